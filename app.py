@@ -1,9 +1,13 @@
 import streamlit as st
-import requests
-import json
+import httpx
+import orjson
+import codecs
+import re
 import os
 import uuid
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from database import init_database, log_interaction, get_session_history, get_statistics
 
 # LLM API Configuration
@@ -13,26 +17,84 @@ LLM_MODEL = "claude-3.7-sonnet-reasoning-gemma3-12b"
 # File to store saved prompts
 SAVED_PROMPTS_FILE = "saved_prompts.json"
 
+# Pooled HTTP client shared across calls to avoid a TCP handshake per prompt
+_llm_client = httpx.Client(
+    timeout=120.0,
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+)
+
+# Process-global prompt cache shared by all sessions, invalidated on mtime
+_prompts_cache = {"mtime": None, "data": None}
+
 # Load saved prompts from file
 def load_saved_prompts():
-    """Load saved prompts from JSON file"""
-    if os.path.exists(SAVED_PROMPTS_FILE):
+    """Load saved prompts from JSON file, cached across sessions"""
+    try:
+        mtime = os.path.getmtime(SAVED_PROMPTS_FILE)
+    except OSError:
+        return []
+
+    if _prompts_cache["mtime"] != mtime:
         try:
-            with open(SAVED_PROMPTS_FILE, 'r') as f:
-                return json.load(f)
+            with open(SAVED_PROMPTS_FILE, 'rb') as f:
+                _prompts_cache["data"] = orjson.loads(f.read())
+            _prompts_cache["mtime"] = mtime
         except Exception:
             return []
-    return []
+
+    # Copy so per-session mutation doesn't leak into the shared cache
+    return list(_prompts_cache["data"])
+
+# Single-worker executor so prompt saves don't block the rerun
+_io_executor = ThreadPoolExecutor(max_workers=1)
+
+def _write_prompts(data):
+    """Write serialized prompts atomically via a temp file"""
+    tmp_file = SAVED_PROMPTS_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, SAVED_PROMPTS_FILE)
 
 # Save prompts to file
 def save_prompts_to_file(prompts):
-    """Save prompts to JSON file"""
+    """Save prompts to JSON file in the background"""
     try:
-        with open(SAVED_PROMPTS_FILE, 'w') as f:
-            json.dump(prompts, f, indent=2)
+        # Serialize up front so the background write sees a stable snapshot
+        data = orjson.dumps(prompts, option=orjson.OPT_INDENT_2)
+        _io_executor.submit(_write_prompts, data)
     except Exception as e:
         st.error(f"Error saving prompts: {str(e)}")
 
+# SSE framing constants, kept as bytes so the hot loop never decodes
+_DATA_PREFIX = b'data: '
+_DONE = b'[DONE]'
+
+# Matches the "content":"..." field inside a streamed delta chunk
+_CONTENT_PATTERN = re.compile(rb'"content"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Extract delta content without deserializing the whole chunk
+def _extract_content(line):
+    """Pull choices[0].delta.content out of an SSE chunk without a full JSON parse"""
+    match = _CONTENT_PATTERN.search(line)
+    if match:
+        raw = match.group(1)
+        if b'\\' not in raw:
+            return raw.decode('utf-8')
+        if b'\\u' not in raw and b'\\/' not in raw:
+            # escape_decode covers \n, \t, \", \\ etc.; \uXXXX and the
+            # JSON-only \/ escape need the full parse
+            return codecs.escape_decode(raw)[0].decode('utf-8')
+
+    # Fall back to a full parse for frames without content (e.g. finish_reason)
+    try:
+        chunk = orjson.loads(line)
+        if 'choices' in chunk and len(chunk['choices']) > 0:
+            delta = chunk['choices'][0].get('delta', {})
+            return delta.get('content', '') or None
+    except orjson.JSONDecodeError:
+        pass
+    return None
+
 # Function to call LLM API with streaming
 def call_llm_stream(messages, placeholder, session_id):
     """Call the local LLM API with streaming for real-time responses"""
@@ -48,28 +110,45 @@ def call_llm_stream(messages, placeholder, session_id):
             "stream": True
         }
 
-        response = requests.post(LLM_API_URL, json=payload, stream=True, timeout=120)
-        response.raise_for_status()
-
-        full_response = ""
-        for line in response.iter_lines():
-            if line:
-                line = line.decode('utf-8')
-                if line.startswith('data: '):
-                    line = line[6:]  # Remove 'data: ' prefix
-                    if line.strip() == '[DONE]':
-                        break
-                    try:
-                        chunk = json.loads(line)
-                        if 'choices' in chunk and len(chunk['choices']) > 0:
-                            delta = chunk['choices'][0].get('delta', {})
-                            content = delta.get('content', '')
-                            if content:
-                                full_response += content
-                                placeholder.markdown(full_response + "▌")
-                    except json.JSONDecodeError:
+        parts = []
+        total_len = 0
+        last_render = time.monotonic()
+        last_render_len = 0
+        done = False
+        buffer = b''
+        with _llm_client.stream("POST", LLM_API_URL, json=payload) as response:
+            response.raise_for_status()
+
+            # Split raw chunks on newlines ourselves; a chunk can end mid-line
+            for raw_chunk in response.iter_raw(chunk_size=8192):
+                buffer += raw_chunk
+                *lines, buffer = buffer.split(b'\n')
+                for line in lines:
+                    line = line.rstrip(b'\r')
+                    if not line:
                         continue
-
+                    if line.startswith(_DATA_PREFIX):
+                        line = line[6:]  # Remove 'data: ' prefix
+                        if line.strip() == _DONE:
+                            done = True
+                            break
+                        content = _extract_content(line)
+                        if content:
+                            # Append fragments and join only when rendering to
+                            # avoid quadratic string concatenation over the stream
+                            parts.append(content)
+                            total_len += len(content)
+                            # Coalesce renders: every WebSocket round-trip forces a
+                            # re-render, so update at most ~20 Hz or every 32 chars
+                            now = time.monotonic()
+                            if now - last_render > 0.05 or total_len - last_render_len > 32:
+                                placeholder.markdown("".join(parts) + "▌")
+                                last_render = now
+                                last_render_len = total_len
+                if done:
+                    break
+
+        full_response = "".join(parts)
         placeholder.markdown(full_response)
 
         # Calculate response time and log interaction
@@ -86,7 +165,7 @@ def call_llm_stream(messages, placeholder, session_id):
 
         return full_response
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         error_msg = "⚠️ The request timed out. The LLM is taking longer than expected to respond. Please try again with a shorter prompt or check if the LLM server is running properly."
         placeholder.markdown(error_msg)
 
@@ -102,7 +181,7 @@ def call_llm_stream(messages, placeholder, session_id):
         )
 
         return error_msg
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         error_msg = "❌ Cannot connect to the LLM server at http://127.0.0.1:1234. Please make sure the LLM server is running."
         placeholder.markdown(error_msg)
 
@@ -118,7 +197,7 @@ def call_llm_stream(messages, placeholder, session_id):
         )
 
         return error_msg
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_msg = f"❌ Error connecting to LLM: {str(e)}"
         placeholder.markdown(error_msg)
 
@@ -160,7 +239,8 @@ st.set_page_config(
 )
 
 # Minimal custom CSS - mostly relying on Streamlit's native styling
-st.markdown("""
+# Kept as a module-level constant so the blob isn't rebuilt per rerun
+_CSS_BLOB = """
     <style>
     /* Main container styling */
     .main .block-container {
@@ -255,7 +335,11 @@ st.markdown("""
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted on every run: Streamlit drops elements that are not
+# re-rendered on rerun, so the style block must be re-injected each time
+st.markdown(_CSS_BLOB, unsafe_allow_html=True)
 
 # Initialize database
 init_database()
@@ -264,8 +348,15 @@ init_database()
 if "messages" not in st.session_state:
     st.session_state["messages"] = []
 
+# Last 5 user prompts for the sidebar, maintained incrementally so the
+# render loop never rescans the full message history
+if "recent_user_prompts" not in st.session_state:
+    st.session_state["recent_user_prompts"] = deque(maxlen=5)
+
 if "saved_prompts" not in st.session_state:
     st.session_state["saved_prompts"] = load_saved_prompts()
+    # Parallel set for O(1) membership checks in the chat-render loop
+    st.session_state["saved_prompts_set"] = set(st.session_state["saved_prompts"])
 
 # Generate unique session ID
 if "session_id" not in st.session_state:
@@ -338,12 +429,14 @@ with st.sidebar:
                 if st.button(prompt, key=f"saved_{i}", use_container_width=True, help=prompt):
                     # Add the prompt to messages again
                     st.session_state.messages.append({"role": "user", "content": prompt})
+                    st.session_state.recent_user_prompts.append(prompt)
                     st.rerun()
 
             with col2:
                 # Delete button with smaller size
                 if st.button("🗑️", key=f"delete_saved_{i}", type="secondary"):
-                    st.session_state.saved_prompts.pop(i)
+                    removed = st.session_state.saved_prompts.pop(i)
+                    st.session_state.saved_prompts_set.discard(removed)
                     save_prompts_to_file(st.session_state.saved_prompts)
                     st.rerun()
     else:
@@ -352,18 +445,14 @@ with st.sidebar:
     # Recent prompts section
     st.markdown("#### Recent Prompts")
 
-    if "messages" in st.session_state and len(st.session_state.messages) > 0:
-        # Get unique user messages (prompts only)
-        user_prompts = [msg["content"] for msg in st.session_state.messages if msg["role"] == "user"]
-
-        # Show last 5 prompts
-        recent_prompts = user_prompts[-5:][::-1]  # Reverse to show most recent first
-
-        for i, prompt in enumerate(recent_prompts):
+    if len(st.session_state.recent_user_prompts) > 0:
+        # Most recent first, O(5) regardless of conversation length
+        for i, prompt in enumerate(reversed(st.session_state.recent_user_prompts)):
             # Display with ellipsis and tooltip showing full prompt
             if st.button(prompt, key=f"recent_{i}", use_container_width=True, help=prompt):
                 # Add the prompt to messages again
                 st.session_state.messages.append({"role": "user", "content": prompt})
+                st.session_state.recent_user_prompts.append(prompt)
                 st.rerun()
     else:
         st.markdown("*No recent prompts yet*")
@@ -414,12 +503,14 @@ if len(st.session_state.messages) == 0:
     # Handle text input submission
     if initial_query:
         st.session_state.messages.append({"role": "user", "content": initial_query})
+        st.session_state.recent_user_prompts.append(initial_query)
         st.rerun()
 
     # Handle pill selection
     if selected:
         query = SAMPLE_QUERIES[selected]
         st.session_state.messages.append({"role": "user", "content": query})
+        st.session_state.recent_user_prompts.append(query)
         st.rerun()
 
 # Display chat messages
@@ -432,9 +523,10 @@ else:
             if msg["role"] == "user":
                 prompt_content = msg["content"]
                 # Check if already saved
-                if prompt_content not in st.session_state.saved_prompts:
+                if prompt_content not in st.session_state.saved_prompts_set:
                     if st.button("💾 Save", key=f"save_msg_{idx}"):
                         st.session_state.saved_prompts.append(prompt_content)
+                        st.session_state.saved_prompts_set.add(prompt_content)
                         save_prompts_to_file(st.session_state.saved_prompts)
                         st.rerun()
                 else:
@@ -460,6 +552,7 @@ if len(st.session_state.messages) > 0:
 # Handle user input from bottom chat input
 if len(st.session_state.messages) > 0 and prompt:
     st.session_state.messages.append({"role": "user", "content": prompt})
+    st.session_state.recent_user_prompts.append(prompt)
     st.chat_message("user").write(prompt)
 
     # Get response from LLM with streaming
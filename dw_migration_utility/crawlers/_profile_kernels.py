@@ -0,0 +1,85 @@
+"""
+Vectorized profiling kernels for numeric column statistics.
+
+Used to populate DataProfile objects from in-memory sample arrays in a
+single fused pass instead of per-value Python loops. Numba accelerates
+the kernel when available; a pure-NumPy path is used otherwise.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .metadata_models import DataProfile
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _numeric_stats(arr: np.ndarray) -> Tuple[int, float, float, float]:
+        """Fused null_count/min/max/sum pass over a float64 array (NaN = NULL)."""
+        null_count = 0
+        total = 0.0
+        min_value = np.inf
+        max_value = -np.inf
+
+        for i in prange(arr.shape[0]):
+            value = arr[i]
+            if np.isnan(value):
+                null_count += 1
+            else:
+                total += value
+                # Call-form min/max is the reduction pattern numba
+                # recognizes under parallel=True; the branch form gets
+                # thread-privatized and merges garbage
+                min_value = min(min_value, value)
+                max_value = max(max_value, value)
+
+        return null_count, min_value, max_value, total
+else:
+    def _numeric_stats(arr: np.ndarray) -> Tuple[int, float, float, float]:
+        """Fused null_count/min/max/sum pass over a float64 array (NaN = NULL)."""
+        isnull = np.isnan(arr)
+        null_count = int(isnull.sum())
+
+        if null_count == arr.shape[0]:
+            return null_count, np.inf, -np.inf, 0.0
+
+        valid = arr[~isnull] if null_count else arr
+        return null_count, float(valid.min()), float(valid.max()), float(valid.sum())
+
+
+def profile_numeric_column(column_name: str, values, total_rows: int = None) -> DataProfile:
+    """
+    Profile a numeric column from an in-memory array of values.
+
+    Args:
+        column_name: Column name for the profile
+        values: Sequence of numeric values (None/NaN treated as NULL)
+        total_rows: Total row count for null percentage (defaults to len(values))
+
+    Returns:
+        DataProfile object with null/distinct/min/max/avg statistics
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    total_rows = total_rows or arr.shape[0]
+
+    null_count, min_value, max_value, total = _numeric_stats(arr)
+    non_null_count = arr.shape[0] - null_count
+
+    # Distinct count stays outside the jitted kernel; np.unique is already C-speed
+    distinct_count = int(np.unique(arr[~np.isnan(arr)]).size) if non_null_count else 0
+
+    return DataProfile(
+        column_name=column_name,
+        null_count=null_count,
+        null_percentage=(null_count / total_rows * 100) if total_rows > 0 else 0,
+        distinct_count=distinct_count,
+        min_value=str(min_value) if non_null_count else None,
+        max_value=str(max_value) if non_null_count else None,
+        avg_value=str(total / non_null_count) if non_null_count else None
+    )
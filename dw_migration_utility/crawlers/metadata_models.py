@@ -1,13 +1,13 @@
 """
 Data models for database metadata.
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict
 from datetime import datetime
-import json
+import orjson
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnMetadata:
     """Metadata for a database column."""
     name: str
@@ -20,13 +20,31 @@ class ColumnMetadata:
     comment: Optional[str] = None
     is_primary_key: bool = False
     is_foreign_key: bool = False
+    name_upper: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Uppercase once at construction; lookups, index builds and the
+        # profilers' type-set membership tests all reuse it
+        self.name_upper = self.name.upper()
+        self.data_type = self.data_type.upper()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'data_type': self.data_type,
+            'length': self.length,
+            'precision': self.precision,
+            'scale': self.scale,
+            'nullable': self.nullable,
+            'default_value': self.default_value,
+            'comment': self.comment,
+            'is_primary_key': self.is_primary_key,
+            'is_foreign_key': self.is_foreign_key
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexMetadata:
     """Metadata for a database index."""
     name: str
@@ -36,10 +54,15 @@ class IndexMetadata:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'columns': self.columns,
+            'is_unique': self.is_unique,
+            'index_type': self.index_type
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintMetadata:
     """Metadata for a database constraint."""
     name: str
@@ -51,10 +74,17 @@ class ConstraintMetadata:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'constraint_type': self.constraint_type,
+            'columns': self.columns,
+            'reference_table': self.reference_table,
+            'reference_columns': self.reference_columns,
+            'check_condition': self.check_condition
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TableMetadata:
     """Metadata for a database table."""
     schema: str
@@ -71,6 +101,12 @@ class TableMetadata:
     clustering_keys: List[str] = field(default_factory=list)
     created_date: Optional[datetime] = None
     last_modified_date: Optional[datetime] = None
+    _column_index: Optional[Dict[str, ColumnMetadata]] = field(default=None, init=False, repr=False, compare=False)
+    table_name_upper: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Uppercase once at construction; lookups and index builds reuse it
+        self.table_name_upper = self.table_name.upper()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -92,18 +128,18 @@ class TableMetadata:
         }
 
     def get_column(self, column_name: str) -> Optional[ColumnMetadata]:
-        """Get column metadata by name."""
-        for col in self.columns:
-            if col.name.upper() == column_name.upper():
-                return col
-        return None
+        """Get column metadata by name (case-insensitive)."""
+        # Build the index lazily; rebuild if columns were added since
+        if self._column_index is None or len(self._column_index) != len(self.columns):
+            self._column_index = {col.name_upper: col for col in self.columns}
+        return self._column_index.get(column_name.upper())
 
     def get_primary_key_columns(self) -> List[ColumnMetadata]:
         """Get list of primary key column metadata."""
         return [col for col in self.columns if col.is_primary_key]
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaMetadata:
     """Metadata for a database schema."""
     database: Optional[str] = None  # For Snowflake
@@ -113,6 +149,7 @@ class SchemaMetadata:
     total_tables: int = 0
     total_views: int = 0
     extraction_date: datetime = field(default_factory=datetime.now)
+    _table_index: Optional[Dict[str, TableMetadata]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -127,22 +164,37 @@ class SchemaMetadata:
         }
 
     def get_table(self, table_name: str) -> Optional[TableMetadata]:
-        """Get table metadata by name."""
-        for table in self.tables:
-            if table.table_name.upper() == table_name.upper():
-                return table
-        return None
+        """Get table metadata by name (case-insensitive)."""
+        # Build the index lazily; rebuild if tables were added since
+        if self._table_index is None or len(self._table_index) != len(self.tables):
+            self._table_index = {table.table_name_upper: table for table in self.tables}
+        return self._table_index.get(table_name.upper())
 
     def save_to_json(self, output_path: str) -> None:
-        """Save metadata to JSON file."""
-        with open(output_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2, default=str)
+        """Save metadata to JSON file, streaming one table at a time."""
+        with open(output_path, 'wb') as f:
+            f.write(b'{"database": ' + orjson.dumps(self.database))
+            f.write(b', "schema_name": ' + orjson.dumps(self.schema_name))
+            # Stream tables individually so the whole schema is never
+            # materialized as one nested dict tree in memory
+            f.write(b', "tables": [')
+            for idx, table in enumerate(self.tables):
+                if idx:
+                    f.write(b', ')
+                f.write(orjson.dumps(table.to_dict(), default=str))
+            f.write(b']')
+            f.write(b', "views": ' + orjson.dumps(self.views))
+            f.write(b', "total_tables": ' + orjson.dumps(self.total_tables))
+            f.write(b', "total_views": ' + orjson.dumps(self.total_views))
+            f.write(b', "extraction_date": ' + orjson.dumps(self.extraction_date.isoformat()))
+            f.write(b'}')
 
     @classmethod
     def load_from_json(cls, input_path: str) -> 'SchemaMetadata':
         """Load metadata from JSON file."""
-        with open(input_path, 'r') as f:
-            data = json.load(f)
+        # orjson parses raw bytes directly, skipping the text decode
+        with open(input_path, 'rb') as f:
+            data = orjson.loads(f.read())
 
         schema = cls(
             database=data.get('database'),
@@ -152,41 +204,42 @@ class SchemaMetadata:
             extraction_date=datetime.fromisoformat(data['extraction_date'])
         )
 
-        # Reconstruct tables
-        for table_data in data.get('tables', []):
-            columns = [ColumnMetadata(**col) for col in table_data.get('columns', [])]
-            foreign_keys = [ConstraintMetadata(**fk) for fk in table_data.get('foreign_keys', [])]
-            indexes = [IndexMetadata(**idx) for idx in table_data.get('indexes', [])]
-            constraints = [ConstraintMetadata(**cons) for cons in table_data.get('constraints', [])]
+        # Localize constructors to avoid repeated global lookups in the loop
+        _column = ColumnMetadata
+        _constraint = ConstraintMetadata
+        _index = IndexMetadata
+        _fromiso = datetime.fromisoformat
 
-            table = TableMetadata(
+        schema.tables = [
+            TableMetadata(
                 schema=table_data['schema'],
                 table_name=table_data['table_name'],
-                columns=columns,
+                columns=[_column(**col) for col in table_data.get('columns', [])],
                 primary_keys=table_data.get('primary_keys', []),
-                foreign_keys=foreign_keys,
-                indexes=indexes,
-                constraints=constraints,
+                foreign_keys=[_constraint(**fk) for fk in table_data.get('foreign_keys', [])],
+                indexes=[_index(**idx) for idx in table_data.get('indexes', [])],
+                constraints=[_constraint(**cons) for cons in table_data.get('constraints', [])],
                 row_count=table_data.get('row_count', 0),
                 table_size_bytes=table_data.get('table_size_bytes', 0),
                 comment=table_data.get('comment'),
                 partitioning_info=table_data.get('partitioning_info'),
                 clustering_keys=table_data.get('clustering_keys', []),
-                created_date=datetime.fromisoformat(table_data['created_date']) if table_data.get('created_date') else None,
-                last_modified_date=datetime.fromisoformat(table_data['last_modified_date']) if table_data.get('last_modified_date') else None
+                created_date=_fromiso(table_data['created_date']) if table_data.get('created_date') else None,
+                last_modified_date=_fromiso(table_data['last_modified_date']) if table_data.get('last_modified_date') else None
             )
-            schema.tables.append(table)
+            for table_data in data.get('tables', [])
+        ]
 
         return schema
 
 
-@dataclass
+@dataclass(slots=True)
 class DataProfile:
     """Data profiling statistics for a column."""
     column_name: str
     null_count: int = 0
     null_percentage: float = 0.0
-    distinct_count: int = 0
+    distinct_count: int = 0  # approximate (HyperLogLog) when crawlers use approx_distinct
     min_value: Optional[Any] = None
     max_value: Optional[Any] = None
     avg_value: Optional[Any] = None
@@ -194,10 +247,19 @@ class DataProfile:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'column_name': self.column_name,
+            'null_count': self.null_count,
+            'null_percentage': self.null_percentage,
+            'distinct_count': self.distinct_count,
+            'min_value': self.min_value,
+            'max_value': self.max_value,
+            'avg_value': self.avg_value,
+            'sample_values': self.sample_values
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TableProfile:
     """Data profiling for a table."""
     schema: str
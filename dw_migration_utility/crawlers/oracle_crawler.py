@@ -1,33 +1,229 @@
 """
 Oracle database crawler for metadata extraction.
 """
-import csv
+import re
+import threading
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-import pandas as pd
+from datetime import datetime
+
+import orjson
 from loguru import logger
 
 from .metadata_models import (
     SchemaMetadata, TableMetadata, ColumnMetadata,
     IndexMetadata, ConstraintMetadata, DataProfile, TableProfile
 )
+from ._profile_kernels import profile_numeric_column
 from ..utils.db_connector import OracleConnector
 
 
 class OracleCrawler:
     """Crawler for extracting metadata from Oracle database."""
 
-    def __init__(self, connector: OracleConnector, output_dir: str = "output/metadata"):
+    # Types profiled with MIN/MAX; built once instead of per call
+    MINMAX_TYPES = frozenset(('NUMBER', 'INTEGER', 'FLOAT', 'DATE', 'TIMESTAMP'))
+
+    # Columns aggregated per profiling query; keeps the select list well
+    # under Oracle's limits on very wide tables
+    PROFILE_CHUNK_SIZE = 50
+
+    def __init__(self, connector: OracleConnector, output_dir: str = "output/metadata", max_workers: int = 8, approx_distinct: bool = True,
+                 exact_row_count: bool = False, use_stats: bool = True,
+                 schema_workers: int = 4, profile_row_threshold: int = 10000):
         """
         Initialize Oracle crawler.
 
         Args:
             connector: Oracle database connector
             output_dir: Directory to save output files
+            max_workers: Number of worker threads for per-table extraction
+            approx_distinct: Use APPROX_COUNT_DISTINCT (HyperLogLog) when profiling
+            exact_row_count: Run SELECT COUNT(*) per table instead of using
+                optimizer statistics (NUM_ROWS from ALL_TABLES)
+            use_stats: Profile columns from ALL_TAB_COL_STATISTICS when the
+                table has been analyzed, instead of scanning it
+            schema_workers: Number of worker processes for crawl_multiple_schemas
+            profile_row_threshold: Tables at or below this row count are
+                fetched once and profiled locally instead of via scans
         """
         self.connector = connector
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Per-table output paths are built as plain strings; Path joins
+        # in the per-table loop cost a PurePath allocation each
+        self._out_prefix = f"{self.output_dir}/oracle_"
+        self.max_workers = max_workers
+        self.approx_distinct = approx_distinct
+        self.exact_row_count = exact_row_count
+        self.use_stats = use_stats
+        self.schema_workers = schema_workers
+        self.profile_row_threshold = profile_row_threshold
+        self._row_counts: Dict[str, int] = {}
+        self._prefetch: Optional[Dict[str, Any]] = None
+        self._thread_local = threading.local()
+        self._worker_connectors = []
+        self._worker_lock = threading.Lock()
+
+    @staticmethod
+    def _q(name: str) -> str:
+        """Quote an identifier for use in dynamic SQL.
+
+        Catalog names can contain reserved words, mixed case or spaces;
+        quoting also keeps generated SQL text consistent so Oracle's
+        cursor cache can reuse parses.
+        """
+        return '"' + name.replace('"', '""') + '"'
+
+    def _get_worker_connector(self) -> OracleConnector:
+        """Get a connector bound to the current worker thread.
+
+        Cursors are not thread-safe, so each worker opens its own
+        connection from the shared config.
+        """
+        connector = getattr(self._thread_local, 'connector', None)
+        if connector is None:
+            connector = OracleConnector(self.connector.config)
+            connector.connect()
+            self._thread_local.connector = connector
+            with self._worker_lock:
+                self._worker_connectors.append(connector)
+        return connector
+
+    def _close_worker_connectors(self) -> None:
+        """Disconnect all per-thread worker connections."""
+        with self._worker_lock:
+            for connector in self._worker_connectors:
+                try:
+                    connector.disconnect()
+                except Exception as e:
+                    logger.debug(f"Error closing worker connection: {e}")
+            self._worker_connectors = []
+        self._thread_local = threading.local()
+
+    def _process_table(self, schema_name: str, table_name: str, sample_size: int) -> Optional[TableMetadata]:
+        """Extract metadata, sample data and profile for one table."""
+        try:
+            connector = self._get_worker_connector()
+            table_metadata = self.extract_table_metadata(schema_name, table_name, connector=connector)
+
+            # Extract sample data
+            sample = self.extract_sample_data(schema_name, table_name, sample_size, connector=connector)
+
+            # Profile data
+            table_profile = self.profile_table_data(schema_name, table_name, table_metadata, connector=connector, sample=sample)
+            self.save_profile(table_profile)
+
+            return table_metadata
+
+        except Exception as e:
+            logger.error(f"Failed to process table {table_name}: {e}")
+            return None
+
+    def _prefetch_catalog(self, schema_name: str) -> Dict[str, Any]:
+        """Fetch catalog metadata for the whole schema, one query per view.
+
+        Per-table dictionary queries each cost a round-trip; on a large
+        schema that multiplies into thousands of tiny queries. One scan
+        per catalog view, grouped by table name in Python, replaces them.
+        Rows are streamed rather than fetched in one burst, since a wide
+        schema can return tens of thousands of catalog rows per view.
+        """
+        params = {'schema': schema_name}
+
+        columns = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, DATA_LENGTH,
+                   DATA_PRECISION, DATA_SCALE, NULLABLE, DATA_DEFAULT, COLUMN_ID
+            FROM ALL_TAB_COLUMNS
+            WHERE OWNER = :schema
+            ORDER BY TABLE_NAME, COLUMN_ID
+        """, params):
+            columns[row[0]].append(row[1:])
+
+        col_comments = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT TABLE_NAME, COLUMN_NAME, COMMENTS
+            FROM ALL_COL_COMMENTS
+            WHERE OWNER = :schema
+        """, params):
+            col_comments[row[0]].append(row[1:])
+
+        pk_cols = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT ac.TABLE_NAME, acc.COLUMN_NAME
+            FROM ALL_CONSTRAINTS ac
+            JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+            WHERE ac.OWNER = :schema AND ac.CONSTRAINT_TYPE = 'P'
+        """, params):
+            pk_cols[row[0]].append(row[1:])
+
+        fks = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT
+                ac.TABLE_NAME, ac.CONSTRAINT_NAME, acc.COLUMN_NAME,
+                ac_ref.TABLE_NAME, acc_ref.COLUMN_NAME
+            FROM ALL_CONSTRAINTS ac
+            JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+            JOIN ALL_CONSTRAINTS ac_ref ON ac.R_CONSTRAINT_NAME = ac_ref.CONSTRAINT_NAME
+            JOIN ALL_CONS_COLUMNS acc_ref ON ac_ref.CONSTRAINT_NAME = acc_ref.CONSTRAINT_NAME
+            WHERE ac.OWNER = :schema AND ac.CONSTRAINT_TYPE = 'R'
+            ORDER BY ac.CONSTRAINT_NAME, acc.POSITION
+        """, params):
+            fks[row[0]].append(row[1:])
+
+        indexes = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT TABLE_NAME, INDEX_NAME, UNIQUENESS
+            FROM ALL_INDEXES
+            WHERE OWNER = :schema
+            AND INDEX_NAME NOT IN (
+                SELECT CONSTRAINT_NAME FROM ALL_CONSTRAINTS
+                WHERE OWNER = :schema AND CONSTRAINT_TYPE IN ('P', 'U')
+            )
+        """, params):
+            indexes[row[0]].append(row[1:])
+
+        idx_columns = defaultdict(list)
+        for row in self.connector.stream_query("""
+            SELECT INDEX_NAME, COLUMN_NAME
+            FROM ALL_IND_COLUMNS
+            WHERE INDEX_OWNER = :schema
+            ORDER BY INDEX_NAME, COLUMN_POSITION
+        """, params):
+            idx_columns[row[0]].append(row[1:])
+
+        table_comments = {}
+        for row in self.connector.stream_query("""
+            SELECT TABLE_NAME, COMMENTS
+            FROM ALL_TAB_COMMENTS
+            WHERE OWNER = :schema
+        """, params):
+            table_comments[row[0]] = row[1]
+
+        partitions = {}
+        for row in self.connector.stream_query("""
+            SELECT TABLE_NAME, PARTITIONING_TYPE, PARTITION_COUNT
+            FROM ALL_PART_TABLES
+            WHERE OWNER = :schema
+        """, params):
+            partitions[row[0]] = row[1:]
+
+        return {
+            'columns': columns,
+            'col_comments': col_comments,
+            'pk_cols': pk_cols,
+            'fks': fks,
+            'indexes': indexes,
+            'idx_columns': idx_columns,
+            'table_comments': table_comments,
+            'partitions': partitions,
+        }
 
     def crawl_schema(self, schema_name: str, sample_size: int = 100) -> SchemaMetadata:
         """
@@ -40,13 +236,17 @@ class OracleCrawler:
         Returns:
             SchemaMetadata object containing all extracted metadata
         """
+        if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_$#]*', schema_name):
+            raise ValueError(f"Invalid schema name: {schema_name!r}")
+
         logger.info(f"Starting to crawl Oracle schema: {schema_name}")
 
         schema_metadata = SchemaMetadata(schema_name=schema_name)
 
-        # Get list of tables in schema
+        # Get list of tables in schema along with optimizer row counts,
+        # so extract_table_metadata can skip a COUNT(*) scan per table
         tables_query = """
-            SELECT TABLE_NAME
+            SELECT TABLE_NAME, NUM_ROWS
             FROM ALL_TABLES
             WHERE OWNER = :schema
             ORDER BY TABLE_NAME
@@ -54,27 +254,28 @@ class OracleCrawler:
 
         tables = self.connector.execute_query(tables_query, {'schema': schema_name})
         schema_metadata.total_tables = len(tables)
+        self._row_counts = {table_name: num_rows or 0 for table_name, num_rows in tables}
 
         logger.info(f"Found {len(tables)} tables in schema {schema_name}")
 
-        # Extract metadata for each table
-        for idx, (table_name,) in enumerate(tables, 1):
-            logger.info(f"Processing table {idx}/{len(tables)}: {table_name}")
-
-            try:
-                table_metadata = self.extract_table_metadata(schema_name, table_name)
-                schema_metadata.tables.append(table_metadata)
-
-                # Extract sample data
-                self.extract_sample_data(schema_name, table_name, sample_size)
-
-                # Profile data
-                table_profile = self.profile_table_data(schema_name, table_name, table_metadata)
-                self.save_profile(table_profile)
+        # One catalog query per view for the whole schema instead of
+        # 6+ dictionary queries per table
+        self._prefetch = self._prefetch_catalog(schema_name)
 
-            except Exception as e:
-                logger.error(f"Failed to process table {table_name}: {e}")
-                continue
+        # Extract metadata for all tables in parallel; each table needs
+        # several round-trips, so overlapping them dominates wall time
+        table_names = [table_name for table_name, _ in tables]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for table_metadata in executor.map(
+                    lambda name: self._process_table(schema_name, name, sample_size),
+                    table_names
+                ):
+                    if table_metadata:
+                        schema_metadata.tables.append(table_metadata)
+        finally:
+            self._close_worker_connectors()
+            self._prefetch = None
 
         # Get list of views
         views_query = """
@@ -94,53 +295,68 @@ class OracleCrawler:
 
         return schema_metadata
 
-    def extract_table_metadata(self, schema: str, table_name: str) -> TableMetadata:
+    def extract_table_metadata(self, schema: str, table_name: str, connector: OracleConnector = None) -> TableMetadata:
         """
         Extract complete metadata for a specific table.
 
         Args:
             schema: Schema name
             table_name: Table name
+            connector: Optional connector override (used by worker threads)
 
         Returns:
             TableMetadata object
         """
+        connector = connector or self.connector
+        prefetched = self._prefetch
         table_metadata = TableMetadata(schema=schema, table_name=table_name)
 
         # Get column information
-        columns_query = """
-            SELECT
-                COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION,
-                DATA_SCALE, NULLABLE, DATA_DEFAULT, COLUMN_ID
-            FROM ALL_TAB_COLUMNS
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-            ORDER BY COLUMN_ID
-        """
-        columns = self.connector.execute_query(columns_query, {'schema': schema, 'table_name': table_name})
+        if prefetched is not None:
+            columns = prefetched['columns'].get(table_name, [])
+        else:
+            columns_query = """
+                SELECT
+                    COLUMN_NAME, DATA_TYPE, DATA_LENGTH, DATA_PRECISION,
+                    DATA_SCALE, NULLABLE, DATA_DEFAULT, COLUMN_ID
+                FROM ALL_TAB_COLUMNS
+                WHERE OWNER = :schema AND TABLE_NAME = :table_name
+                ORDER BY COLUMN_ID
+            """
+            columns = connector.execute_query(columns_query, {'schema': schema, 'table_name': table_name})
 
         # Get column comments
-        col_comments_query = """
-            SELECT COLUMN_NAME, COMMENTS
-            FROM ALL_COL_COMMENTS
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-        """
-        col_comments = self.connector.execute_query(col_comments_query, {'schema': schema, 'table_name': table_name})
+        if prefetched is not None:
+            col_comments = prefetched['col_comments'].get(table_name, [])
+        else:
+            col_comments_query = """
+                SELECT COLUMN_NAME, COMMENTS
+                FROM ALL_COL_COMMENTS
+                WHERE OWNER = :schema AND TABLE_NAME = :table_name
+            """
+            col_comments = connector.execute_query(col_comments_query, {'schema': schema, 'table_name': table_name})
         comments_dict = {col[0]: col[1] for col in col_comments}
 
         # Get primary key columns
-        pk_query = """
-            SELECT COLUMN_NAME
-            FROM ALL_CONS_COLUMNS
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-            AND CONSTRAINT_NAME IN (
-                SELECT CONSTRAINT_NAME FROM ALL_CONSTRAINTS
+        if prefetched is not None:
+            pk_cols = prefetched['pk_cols'].get(table_name, [])
+        else:
+            pk_query = """
+                SELECT COLUMN_NAME
+                FROM ALL_CONS_COLUMNS
                 WHERE OWNER = :schema AND TABLE_NAME = :table_name
-                AND CONSTRAINT_TYPE = 'P'
-            )
-        """
-        pk_cols = self.connector.execute_query(pk_query, {'schema': schema, 'table_name': table_name})
-        pk_set = {col[0] for col in pk_cols}
-        table_metadata.primary_keys = list(pk_set)
+                AND CONSTRAINT_NAME IN (
+                    SELECT CONSTRAINT_NAME FROM ALL_CONSTRAINTS
+                    WHERE OWNER = :schema AND TABLE_NAME = :table_name
+                    AND CONSTRAINT_TYPE = 'P'
+                )
+            """
+            pk_cols = connector.execute_query(pk_query, {'schema': schema, 'table_name': table_name})
+        # Keep the catalog's column order: composite key order matters
+        # for the generated DDL downstream
+        pk_list = [col[0] for col in pk_cols]
+        pk_set = set(pk_list)
+        table_metadata.primary_keys = pk_list
 
         # Build column metadata
         for col in columns:
@@ -158,32 +374,30 @@ class OracleCrawler:
             table_metadata.columns.append(col_metadata)
 
         # Get foreign keys
-        fk_query = """
-            SELECT
-                ac.CONSTRAINT_NAME, acc.COLUMN_NAME,
-                ac_ref.TABLE_NAME, acc_ref.COLUMN_NAME
-            FROM ALL_CONSTRAINTS ac
-            JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
-            JOIN ALL_CONSTRAINTS ac_ref ON ac.R_CONSTRAINT_NAME = ac_ref.CONSTRAINT_NAME
-            JOIN ALL_CONS_COLUMNS acc_ref ON ac_ref.CONSTRAINT_NAME = acc_ref.CONSTRAINT_NAME
-            WHERE ac.OWNER = :schema AND ac.TABLE_NAME = :table_name
-            AND ac.CONSTRAINT_TYPE = 'R'
-            ORDER BY ac.CONSTRAINT_NAME, acc.POSITION
-        """
-        fks = self.connector.execute_query(fk_query, {'schema': schema, 'table_name': table_name})
+        if prefetched is not None:
+            fks = prefetched['fks'].get(table_name, [])
+        else:
+            fk_query = """
+                SELECT
+                    ac.CONSTRAINT_NAME, acc.COLUMN_NAME,
+                    ac_ref.TABLE_NAME, acc_ref.COLUMN_NAME
+                FROM ALL_CONSTRAINTS ac
+                JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+                JOIN ALL_CONSTRAINTS ac_ref ON ac.R_CONSTRAINT_NAME = ac_ref.CONSTRAINT_NAME
+                JOIN ALL_CONS_COLUMNS acc_ref ON ac_ref.CONSTRAINT_NAME = acc_ref.CONSTRAINT_NAME
+                WHERE ac.OWNER = :schema AND ac.TABLE_NAME = :table_name
+                AND ac.CONSTRAINT_TYPE = 'R'
+                ORDER BY ac.CONSTRAINT_NAME, acc.POSITION
+            """
+            fks = connector.execute_query(fk_query, {'schema': schema, 'table_name': table_name})
 
         # Group foreign keys by constraint name
-        fk_dict = {}
+        fk_dict = defaultdict(lambda: {'columns': [], 'ref_table': None, 'ref_columns': []})
         for fk in fks:
-            constraint_name = fk[0]
-            if constraint_name not in fk_dict:
-                fk_dict[constraint_name] = {
-                    'columns': [],
-                    'ref_table': fk[2],
-                    'ref_columns': []
-                }
-            fk_dict[constraint_name]['columns'].append(fk[1])
-            fk_dict[constraint_name]['ref_columns'].append(fk[3])
+            entry = fk_dict[fk[0]]
+            entry['ref_table'] = entry['ref_table'] or fk[2]
+            entry['columns'].append(fk[1])
+            entry['ref_columns'].append(fk[3])
 
         for constraint_name, fk_info in fk_dict.items():
             fk_metadata = ConstraintMetadata(
@@ -196,28 +410,34 @@ class OracleCrawler:
             table_metadata.foreign_keys.append(fk_metadata)
 
         # Get indexes
-        idx_query = """
-            SELECT INDEX_NAME, UNIQUENESS
-            FROM ALL_INDEXES
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-            AND INDEX_NAME NOT IN (
-                SELECT CONSTRAINT_NAME FROM ALL_CONSTRAINTS
+        if prefetched is not None:
+            indexes = prefetched['indexes'].get(table_name, [])
+        else:
+            idx_query = """
+                SELECT INDEX_NAME, UNIQUENESS
+                FROM ALL_INDEXES
                 WHERE OWNER = :schema AND TABLE_NAME = :table_name
-                AND CONSTRAINT_TYPE IN ('P', 'U')
-            )
-        """
-        indexes = self.connector.execute_query(idx_query, {'schema': schema, 'table_name': table_name})
+                AND INDEX_NAME NOT IN (
+                    SELECT CONSTRAINT_NAME FROM ALL_CONSTRAINTS
+                    WHERE OWNER = :schema AND TABLE_NAME = :table_name
+                    AND CONSTRAINT_TYPE IN ('P', 'U')
+                )
+            """
+            indexes = connector.execute_query(idx_query, {'schema': schema, 'table_name': table_name})
 
         for idx in indexes:
             idx_name = idx[0]
             # Get index columns
-            idx_cols_query = """
-                SELECT COLUMN_NAME
-                FROM ALL_IND_COLUMNS
-                WHERE INDEX_OWNER = :schema AND INDEX_NAME = :idx_name
-                ORDER BY COLUMN_POSITION
-            """
-            idx_cols = self.connector.execute_query(idx_cols_query, {'schema': schema, 'idx_name': idx_name})
+            if prefetched is not None:
+                idx_cols = prefetched['idx_columns'].get(idx_name, [])
+            else:
+                idx_cols_query = """
+                    SELECT COLUMN_NAME
+                    FROM ALL_IND_COLUMNS
+                    WHERE INDEX_OWNER = :schema AND INDEX_NAME = :idx_name
+                    ORDER BY COLUMN_POSITION
+                """
+                idx_cols = connector.execute_query(idx_cols_query, {'schema': schema, 'idx_name': idx_name})
 
             idx_metadata = IndexMetadata(
                 name=idx_name,
@@ -226,31 +446,42 @@ class OracleCrawler:
             )
             table_metadata.indexes.append(idx_metadata)
 
-        # Get row count
-        try:
-            count_query = f'SELECT COUNT(*) FROM {schema}.{table_name}'
-            count_result = self.connector.execute_query(count_query)
-            table_metadata.row_count = count_result[0][0] if count_result else 0
-        except Exception as e:
-            logger.warning(f"Could not get row count for {schema}.{table_name}: {e}")
-            table_metadata.row_count = 0
+        # Get row count: optimizer statistics avoid a full scan per table;
+        # COUNT(*) is opt-in for callers that need exact numbers
+        if self.exact_row_count or table_name not in self._row_counts:
+            try:
+                count_query = f'SELECT COUNT(*) FROM {self._q(schema)}.{self._q(table_name)}'
+                count_result = connector.execute_query(count_query)
+                table_metadata.row_count = count_result[0][0] if count_result else 0
+            except Exception as e:
+                logger.warning(f"Could not get row count for {schema}.{table_name}: {e}")
+                table_metadata.row_count = 0
+        else:
+            table_metadata.row_count = self._row_counts[table_name]
 
         # Get table comment
-        table_comment_query = """
-            SELECT COMMENTS
-            FROM ALL_TAB_COMMENTS
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-        """
-        comments = self.connector.execute_query(table_comment_query, {'schema': schema, 'table_name': table_name})
-        table_metadata.comment = comments[0][0] if comments and comments[0][0] else None
+        if prefetched is not None:
+            table_metadata.comment = prefetched['table_comments'].get(table_name) or None
+        else:
+            table_comment_query = """
+                SELECT COMMENTS
+                FROM ALL_TAB_COMMENTS
+                WHERE OWNER = :schema AND TABLE_NAME = :table_name
+            """
+            comments = connector.execute_query(table_comment_query, {'schema': schema, 'table_name': table_name})
+            table_metadata.comment = comments[0][0] if comments and comments[0][0] else None
 
         # Get partitioning info
-        part_query = """
-            SELECT PARTITIONING_TYPE, PARTITION_COUNT
-            FROM ALL_PART_TABLES
-            WHERE OWNER = :schema AND TABLE_NAME = :table_name
-        """
-        part_info = self.connector.execute_query(part_query, {'schema': schema, 'table_name': table_name})
+        if prefetched is not None:
+            part_row = prefetched['partitions'].get(table_name)
+            part_info = [part_row] if part_row else []
+        else:
+            part_query = """
+                SELECT PARTITIONING_TYPE, PARTITION_COUNT
+                FROM ALL_PART_TABLES
+                WHERE OWNER = :schema AND TABLE_NAME = :table_name
+            """
+            part_info = connector.execute_query(part_query, {'schema': schema, 'table_name': table_name})
         if part_info:
             table_metadata.partitioning_info = {
                 'type': part_info[0][0],
@@ -259,7 +490,7 @@ class OracleCrawler:
 
         return table_metadata
 
-    def extract_sample_data(self, schema: str, table_name: str, sample_size: int = 100) -> None:
+    def extract_sample_data(self, schema: str, table_name: str, sample_size: int = 100, connector: OracleConnector = None) -> Optional[tuple]:
         """
         Extract sample data from a table and save to CSV.
 
@@ -267,28 +498,128 @@ class OracleCrawler:
             schema: Schema name
             table_name: Table name
             sample_size: Number of rows to sample
+            connector: Optional connector override (used by worker threads)
+
+        Returns:
+            Tuple of (column names, first rows) for reuse by profiling,
+            or None when no rows were fetched
         """
+        connector = connector or self.connector
         try:
-            query = f'SELECT * FROM {schema}.{table_name} WHERE ROWNUM <= {sample_size}'
-            results = self.connector.execute_query(query)
+            query = f'SELECT * FROM {self._q(schema)}.{self._q(table_name)} WHERE ROWNUM <= {sample_size}'
+
+            # Stream rows in batches so memory stays bounded when callers
+            # pass large sample sizes; pyarrow serializes each batch to
+            # CSV in C instead of formatting cell-by-cell in Python
+            writer = None
+            col_names = None
+            head_rows = None
+            output_file = self._out_prefix + f"{schema}_{table_name}_sample.csv"
+            for chunk in connector.execute_query_iter(query, arraysize=1000):
+                cols = list(zip(*chunk))
+                batch = pa.table({
+                    desc[0]: pa.array([str(v) if v is not None else None for v in col])
+                    for desc, col in zip(connector.cursor.description, cols)
+                })
+                if writer is None:
+                    writer = pacsv.CSVWriter(output_file, batch.schema)
+                    col_names = [desc[0] for desc in connector.cursor.description]
+                    head_rows = chunk[:5]
+                writer.write_table(batch)
+
+            if writer is not None:
+                writer.close()
+                logger.debug(f"Sample data saved: {output_file}")
+                return col_names, head_rows
 
-            if results:
-                # Get column names
-                col_names = [desc[0] for desc in self.connector.cursor.description]
+        except Exception as e:
+            logger.warning(f"Could not extract sample data for {schema}.{table_name}: {e}")
 
-                # Save to CSV
-                output_file = self.output_dir / f"oracle_{schema}_{table_name}_sample.csv"
-                with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(col_names)
-                    writer.writerows(results)
+        return None
 
-                logger.debug(f"Sample data saved: {output_file}")
+    @staticmethod
+    def _decode_stat_value(raw: bytes, data_type: str) -> Optional[Any]:
+        """Decode a LOW_VALUE/HIGH_VALUE RAW from ALL_TAB_COL_STATISTICS.
+
+        Handles Oracle's internal NUMBER and DATE encodings; other types
+        return None and keep the profile's min/max unset.
+        """
+        if raw is None:
+            return None
+        try:
+            if data_type in ('NUMBER', 'INTEGER', 'FLOAT'):
+                exp = raw[0]
+                if exp & 0x80:
+                    exponent = (exp & 0x7f) - 65
+                    digits = [b - 1 for b in raw[1:]]
+                    sign = 1
+                else:
+                    exponent = (~exp & 0x7f) - 65
+                    digits = [101 - b for b in raw[1:] if b != 102]
+                    sign = -1
+                if not digits:
+                    return 0
+                value = 0
+                for digit in digits:
+                    value = value * 100 + digit
+                return sign * value * 100 ** (exponent - len(digits) + 1)
+            if data_type == 'DATE':
+                century, year, month, day, hour, minute, second = raw[:7]
+                return datetime((century - 100) * 100 + (year - 100), month, day,
+                                hour - 1, minute - 1, second - 1)
+        except Exception:
+            return None
+        return None
+
+    def _profile_from_stats(self, schema: str, table_name: str, table_metadata: TableMetadata,
+                            connector: OracleConnector) -> Optional[List[DataProfile]]:
+        """Build column profiles from optimizer statistics.
+
+        ALL_TAB_COL_STATISTICS already stores null/distinct counts and
+        raw min/max endpoints per column, so an analyzed table can be
+        profiled with one dictionary read and zero scans.
 
+        Returns:
+            List of DataProfile objects, or None when statistics are
+            missing and the caller should fall back to scanning
+        """
+        stats_query = """
+            SELECT COLUMN_NAME, NUM_DISTINCT, NUM_NULLS, LOW_VALUE, HIGH_VALUE, LAST_ANALYZED
+            FROM ALL_TAB_COL_STATISTICS
+            WHERE OWNER = :schema AND TABLE_NAME = :table_name
+        """
+        try:
+            rows = connector.execute_query(stats_query, {'schema': schema, 'table_name': table_name})
         except Exception as e:
-            logger.warning(f"Could not extract sample data for {schema}.{table_name}: {e}")
+            logger.debug(f"Could not read column statistics for {schema}.{table_name}: {e}")
+            return None
+
+        stats = {row[0]: row for row in rows if row[5] is not None}
+        if not stats:
+            return None
 
-    def profile_table_data(self, schema: str, table_name: str, table_metadata: TableMetadata) -> TableProfile:
+        row_count = table_metadata.row_count
+        profiles = []
+        for column in table_metadata.columns:
+            row = stats.get(column.name)
+            if row is None:
+                return None
+
+            col_profile = DataProfile(
+                column_name=column.name,
+                null_count=row[2],
+                null_percentage=(row[2] / row_count * 100) if row_count > 0 else 0,
+                distinct_count=row[1]
+            )
+            min_value = self._decode_stat_value(row[3], column.data_type)
+            max_value = self._decode_stat_value(row[4], column.data_type)
+            col_profile.min_value = str(min_value) if min_value is not None else None
+            col_profile.max_value = str(max_value) if max_value is not None else None
+            profiles.append(col_profile)
+
+        return profiles
+
+    def profile_table_data(self, schema: str, table_name: str, table_metadata: TableMetadata, connector: OracleConnector = None, sample: Optional[tuple] = None) -> TableProfile:
         """
         Profile table data to get statistics.
 
@@ -296,58 +627,160 @@ class OracleCrawler:
             schema: Schema name
             table_name: Table name
             table_metadata: Table metadata
+            connector: Optional connector override (used by worker threads)
+            sample: Optional (column names, rows) from extract_sample_data
 
         Returns:
             TableProfile object
         """
+        connector = connector or self.connector
         profile = TableProfile(schema=schema, table_name=table_name, row_count=table_metadata.row_count)
 
         if table_metadata.row_count == 0:
             return profile
 
-        for column in table_metadata.columns:
-            try:
-                # Get column statistics
-                stats_query = f"""
-                    SELECT
-                        COUNT(*) - COUNT({column.name}) as NULL_COUNT,
-                        COUNT(DISTINCT {column.name}) as DISTINCT_COUNT
-                    FROM {schema}.{table_name}
-                """
+        # Optimizer statistics already hold null/distinct/min/max per
+        # column; reading them costs one dictionary query and no scans
+        stats_profiles = None
+        if self.use_stats:
+            stats_profiles = self._profile_from_stats(schema, table_name, table_metadata, connector)
+
+        if stats_profiles is not None:
+            profile.column_profiles = stats_profiles
+        elif table_metadata.row_count <= self.profile_row_threshold:
+            # Small tables are cheaper to pull once and profile locally
+            # than to aggregate through the planner
+            self._profile_locally(schema, table_name, table_metadata, connector, profile)
+        else:
+            self._profile_with_queries(schema, table_name, table_metadata, connector, profile)
+
+        # Seed sample values from the rows extract_sample_data already
+        # fetched; a dedicated 5-row fetch is only needed without them
+        try:
+            if sample is not None:
+                col_names, samples = sample
+            else:
+                sample_query = f'SELECT * FROM {self._q(schema)}.{self._q(table_name)} WHERE ROWNUM <= 5'
+                samples = connector.execute_query(sample_query)
+                col_names = [desc[0] for desc in connector.cursor.description]
+            if samples:
+                col_positions = {name: i for i, name in enumerate(col_names)}
+                for col_profile in profile.column_profiles:
+                    idx = col_positions.get(col_profile.column_name)
+                    if idx is not None:
+                        col_profile.sample_values = sorted(
+                            {str(s[idx]) for s in samples if s[idx] is not None}
+                        )
+        except Exception as e:
+            logger.debug(f"Could not collect sample values for {schema}.{table_name}: {e}")
 
-                stats = self.connector.execute_query(stats_query)
+        return profile
 
-                if stats:
-                    null_count = stats[0][0]
-                    distinct_count = stats[0][1]
+    def _profile_locally(self, schema: str, table_name: str, table_metadata: TableMetadata,
+                         connector: OracleConnector, profile: TableProfile) -> None:
+        """Profile a small table from a single full fetch.
 
-                    col_profile = DataProfile(
-                        column_name=column.name,
-                        null_count=null_count,
-                        null_percentage=(null_count / table_metadata.row_count * 100) if table_metadata.row_count > 0 else 0,
-                        distinct_count=distinct_count
-                    )
+        One round-trip plus local aggregation beats running aggregate
+        scans through the planner when the table is tiny.
+        """
+        try:
+            rows = connector.execute_query(f'SELECT * FROM {self._q(schema)}.{self._q(table_name)}')
+        except Exception as e:
+            logger.debug(f"Could not fetch {schema}.{table_name} for local profiling: {e}")
+            return
 
-                    # Get min/max for numeric and date columns
-                    if column.data_type in ('NUMBER', 'INTEGER', 'FLOAT', 'DATE', 'TIMESTAMP'):
-                        minmax_query = f"SELECT MIN({column.name}), MAX({column.name}) FROM {schema}.{table_name}"
-                        minmax = self.connector.execute_query(minmax_query)
-                        if minmax:
-                            col_profile.min_value = str(minmax[0][0]) if minmax[0][0] else None
-                            col_profile.max_value = str(minmax[0][1]) if minmax[0][1] else None
+        if not rows:
+            return
 
-                    # Get sample values (top 5)
-                    sample_query = f"SELECT DISTINCT {column.name} FROM {schema}.{table_name} WHERE {column.name} IS NOT NULL AND ROWNUM <= 5"
-                    samples = self.connector.execute_query(sample_query)
-                    col_profile.sample_values = [str(s[0]) for s in samples]
+        col_positions = {desc[0]: i for i, desc in enumerate(connector.cursor.description)}
+        row_count = len(rows)
+        numeric_types = ('NUMBER', 'INTEGER', 'FLOAT')
 
-                    profile.column_profiles.append(col_profile)
+        for column in table_metadata.columns:
+            idx = col_positions.get(column.name)
+            if idx is None:
+                continue
+
+            values = [row[idx] for row in rows]
+            if column.data_type in numeric_types:
+                # Vectorized kernel: fused null/min/max/sum pass
+                col_profile = profile_numeric_column(
+                    column.name,
+                    [float(v) if v is not None else float('nan') for v in values],
+                    total_rows=row_count
+                )
+            else:
+                non_null = [v for v in values if v is not None]
+                null_count = row_count - len(non_null)
+                col_profile = DataProfile(
+                    column_name=column.name,
+                    null_count=null_count,
+                    null_percentage=(null_count / row_count * 100) if row_count > 0 else 0,
+                    distinct_count=len(set(map(str, non_null)))
+                )
+                if column.data_type in self.MINMAX_TYPES and non_null:
+                    col_profile.min_value = str(min(non_null))
+                    col_profile.max_value = str(max(non_null))
+
+            profile.column_profiles.append(col_profile)
+
+    def _profile_with_queries(self, schema: str, table_name: str, table_metadata: TableMetadata,
+                              connector: OracleConnector, profile: TableProfile) -> None:
+        """Profile columns with chunked single-scan aggregate queries."""
+        minmax_types = self.MINMAX_TYPES
+
+        # Compute all column aggregates in one scan per chunk instead of
+        # 2-3 full-table queries per column
+        chunk_size = self.PROFILE_CHUNK_SIZE
+        columns = table_metadata.columns
+        for start in range(0, len(columns), chunk_size):
+            chunk = columns[start:start + chunk_size]
+
+            agg_parts = []
+            for column in chunk:
+                col = self._q(column.name)
+                agg_parts.append(f"COUNT(*) - COUNT({col})")
+                # HyperLogLog is 5-50x cheaper than an exact distinct and
+                # well within tolerance for migration planning
+                if self.approx_distinct:
+                    agg_parts.append(f"APPROX_COUNT_DISTINCT({col})")
+                else:
+                    agg_parts.append(f"COUNT(DISTINCT {col})")
+                if column.data_type in minmax_types:
+                    agg_parts.append(f"MIN({col})")
+                    agg_parts.append(f"MAX({col})")
+
+            stats_query = f"SELECT {', '.join(agg_parts)} FROM {self._q(schema)}.{self._q(table_name)}"
 
+            try:
+                stats = connector.execute_query(stats_query)
             except Exception as e:
-                logger.debug(f"Could not profile column {column.name}: {e}")
+                logger.debug(f"Could not profile columns of {schema}.{table_name}: {e}")
                 continue
 
-        return profile
+            if not stats:
+                continue
+
+            row = stats[0]
+            pos = 0
+            for column in chunk:
+                null_count = row[pos]
+                distinct_count = row[pos + 1]
+                pos += 2
+
+                col_profile = DataProfile(
+                    column_name=column.name,
+                    null_count=null_count,
+                    null_percentage=(null_count / table_metadata.row_count * 100) if table_metadata.row_count > 0 else 0,
+                    distinct_count=distinct_count
+                )
+
+                if column.data_type in minmax_types:
+                    col_profile.min_value = str(row[pos]) if row[pos] is not None else None
+                    col_profile.max_value = str(row[pos + 1]) if row[pos + 1] is not None else None
+                    pos += 2
+
+                profile.column_profiles.append(col_profile)
 
     def save_profile(self, profile: TableProfile) -> None:
         """
@@ -356,10 +789,11 @@ class OracleCrawler:
         Args:
             profile: TableProfile object
         """
-        output_file = self.output_dir / f"oracle_{profile.schema}_{profile.table_name}_profile.json"
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(profile.to_dict(), f, indent=2, default=str)
+        output_file = self._out_prefix + f"{profile.schema}_{profile.table_name}_profile.json"
+        # orjson encodes in C; one profile is written per table, so the
+        # stdlib encoder shows up at schema scale
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(profile.to_dict(), option=orjson.OPT_INDENT_2, default=str))
 
     def crawl_multiple_schemas(self, schema_names: List[str], sample_size: int = 100) -> List[SchemaMetadata]:
         """
@@ -372,13 +806,36 @@ class OracleCrawler:
         Returns:
             List of SchemaMetadata objects
         """
-        schemas = []
-        for schema_name in schema_names:
-            try:
-                schema_metadata = self.crawl_schema(schema_name, sample_size)
-                schemas.append(schema_metadata)
-            except Exception as e:
-                logger.error(f"Failed to crawl schema {schema_name}: {e}")
-                continue
-
-        return schemas
+        # Schemas fan out across processes: each owns its connection and
+        # the CPU-bound JSON/CSV encoding escapes the GIL
+        crawler_kwargs = {
+            'max_workers': self.max_workers,
+            'approx_distinct': self.approx_distinct,
+            'exact_row_count': self.exact_row_count,
+            'use_stats': self.use_stats,
+            'profile_row_threshold': self.profile_row_threshold,
+        }
+        worker = partial(
+            _crawl_schema_process,
+            self.connector.config, str(self.output_dir),
+            sample_size=sample_size, crawler_kwargs=crawler_kwargs
+        )
+        with ProcessPoolExecutor(max_workers=self.schema_workers) as executor:
+            return [schema for schema in executor.map(worker, schema_names) if schema]
+
+
+def _crawl_schema_process(config: Dict[str, Any], output_dir: str, schema_name: str,
+                          sample_size: int = 100, crawler_kwargs: Dict[str, Any] = None) -> Optional[SchemaMetadata]:
+    """Crawl one schema inside a worker process.
+
+    Lives at module level so it is picklable; connectors hold live
+    sockets and cannot cross process boundaries, so each worker opens
+    its own connection from the shared config.
+    """
+    try:
+        with OracleConnector(config) as connector:
+            crawler = OracleCrawler(connector, output_dir=output_dir, **(crawler_kwargs or {}))
+            return crawler.crawl_schema(schema_name, sample_size)
+    except Exception as e:
+        logger.error(f"Failed to crawl schema {schema_name}: {e}")
+        return None
@@ -2,8 +2,14 @@
 Snowflake database crawler for metadata extraction.
 """
 import csv
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import orjson
 import pandas as pd
 from loguru import logger
 
@@ -17,17 +23,169 @@ from ..utils.db_connector import SnowflakeConnector
 class SnowflakeCrawler:
     """Crawler for extracting metadata from Snowflake database."""
 
-    def __init__(self, connector: SnowflakeConnector, output_dir: str = "output/metadata"):
+    # Types profiled with MIN/MAX and AVG; built once instead of per call
+    MINMAX_TYPES = frozenset(('NUMBER', 'INTEGER', 'FLOAT', 'DATE', 'TIMESTAMP', 'TIMESTAMP_NTZ', 'TIMESTAMP_LTZ', 'TIMESTAMP_TZ'))
+    AVG_TYPES = frozenset(('NUMBER', 'INTEGER', 'FLOAT'))
+
+    # Columns aggregated per profiling query; keeps the select list
+    # manageable on very wide tables
+    PROFILE_CHUNK_SIZE = 50
+
+    def __init__(self, connector: SnowflakeConnector, output_dir: str = "output/metadata", max_workers: int = 8, approx_distinct: bool = True, schema_workers: int = 4, sample_format: str = 'parquet',
+                 profile_row_threshold: int = 10000):
         """
         Initialize Snowflake crawler.
 
         Args:
             connector: Snowflake database connector
             output_dir: Directory to save output files
+            max_workers: Number of worker threads for per-table extraction
+            approx_distinct: Use APPROX_COUNT_DISTINCT (HyperLogLog) when profiling
+            schema_workers: Number of worker processes for crawl_multiple_schemas
+            sample_format: 'parquet' stages samples server-side and downloads
+                one compressed file; 'csv' streams rows through the driver
+            profile_row_threshold: Tables at or below this row count are
+                fetched once and profiled locally instead of via scans
         """
         self.connector = connector
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Per-table output paths are built as plain strings; Path joins
+        # in the per-table loop cost a PurePath allocation each
+        self._out_prefix = f"{self.output_dir}/snowflake_"
+        self.max_workers = max_workers
+        self.approx_distinct = approx_distinct
+        self.schema_workers = schema_workers
+        self.sample_format = sample_format
+        self.profile_row_threshold = profile_row_threshold
+        self._prefetch: Optional[Dict[str, Any]] = None
+        self._thread_local = threading.local()
+        self._worker_connectors = []
+        self._worker_lock = threading.Lock()
+
+    @staticmethod
+    def _q(name: str) -> str:
+        """Quote an identifier for use in dynamic SQL.
+
+        Catalog names can contain reserved words, mixed case or spaces;
+        quoting keeps the generated SQL valid for all of them.
+        """
+        return '"' + name.replace('"', '""') + '"'
+
+    def _get_worker_connector(self) -> SnowflakeConnector:
+        """Get a connector bound to the current worker thread.
+
+        Cursors are not thread-safe, so each worker opens its own
+        connection from the shared config.
+        """
+        connector = getattr(self._thread_local, 'connector', None)
+        if connector is None:
+            connector = SnowflakeConnector(self.connector.config)
+            connector.connect()
+            self._thread_local.connector = connector
+            with self._worker_lock:
+                self._worker_connectors.append(connector)
+        return connector
+
+    def _close_worker_connectors(self) -> None:
+        """Disconnect all per-thread worker connections."""
+        with self._worker_lock:
+            for connector in self._worker_connectors:
+                try:
+                    connector.disconnect()
+                except Exception as e:
+                    logger.debug(f"Error closing worker connection: {e}")
+            self._worker_connectors = []
+        self._thread_local = threading.local()
+
+    def _process_table(self, database: str, schema_name: str, table_name: str, sample_size: int) -> Optional[TableMetadata]:
+        """Extract metadata, sample data and profile for one table."""
+        try:
+            connector = self._get_worker_connector()
+            table_metadata = self.extract_table_metadata(database, schema_name, table_name, connector=connector)
+
+            # Extract sample data
+            sample = self.extract_sample_data(database, schema_name, table_name, sample_size, connector=connector)
+
+            # Profile data
+            table_profile = self.profile_table_data(database, schema_name, table_name, table_metadata, connector=connector, sample=sample)
+            self.save_profile(table_profile)
+
+            return table_metadata
+
+        except Exception as e:
+            logger.error(f"Failed to process table {table_name}: {e}")
+            return None
+
+    def _prefetch_catalog(self, database: str, schema_name: str) -> Dict[str, Any]:
+        """Fetch catalog metadata for the whole schema, one query per view.
+
+        Per-table INFORMATION_SCHEMA queries each cost a round-trip; on a
+        large schema that multiplies into thousands of tiny queries. One
+        scan per view, grouped by table name in Python, replaces them.
+        """
+        columns = defaultdict(list)
+        for row in self.connector.execute_query(f"""
+            SELECT
+                TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+                NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE,
+                COLUMN_DEFAULT, COMMENT, ORDINAL_POSITION
+            FROM {database}.INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = '{schema_name}'
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """):
+            columns[row['TABLE_NAME']].append(row)
+
+        pk_cols = defaultdict(list)
+        for row in self.connector.execute_query(f"""
+            SELECT tc.TABLE_NAME, kcu.COLUMN_NAME
+            FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+                AND tc.TABLE_NAME = kcu.TABLE_NAME
+            WHERE tc.TABLE_SCHEMA = '{schema_name}'
+            AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            ORDER BY tc.TABLE_NAME, kcu.ORDINAL_POSITION
+        """):
+            pk_cols[row['TABLE_NAME']].append(row)
+
+        fks = defaultdict(list)
+        for row in self.connector.execute_query(f"""
+            SELECT
+                tc.TABLE_NAME,
+                tc.CONSTRAINT_NAME,
+                kcu.COLUMN_NAME,
+                rc.UNIQUE_CONSTRAINT_NAME,
+                kcu2.TABLE_NAME AS REFERENCED_TABLE,
+                kcu2.COLUMN_NAME AS REFERENCED_COLUMN
+            FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+            JOIN {database}.INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+                ON tc.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu2
+                ON rc.UNIQUE_CONSTRAINT_NAME = kcu2.CONSTRAINT_NAME
+            WHERE tc.TABLE_SCHEMA = '{schema_name}'
+            AND tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
+            ORDER BY tc.TABLE_NAME, tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+        """):
+            fks[row['TABLE_NAME']].append(row)
+
+        stats = {}
+        for row in self.connector.execute_query(f"""
+            SELECT TABLE_NAME, ROW_COUNT, BYTES, CREATED, LAST_ALTERED, COMMENT
+            FROM {database}.INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = '{schema_name}'
+        """):
+            stats[row['TABLE_NAME']] = row
+
+        return {
+            'columns': columns,
+            'pk_cols': pk_cols,
+            'fks': fks,
+            'stats': stats,
+        }
 
     def crawl_schema(self, database: str, schema_name: str, sample_size: int = 100) -> SchemaMetadata:
         """
@@ -41,6 +199,10 @@ class SnowflakeCrawler:
         Returns:
             SchemaMetadata object containing all extracted metadata
         """
+        for name in (database, schema_name):
+            if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_$#]*', name):
+                raise ValueError(f"Invalid identifier: {name!r}")
+
         logger.info(f"Starting to crawl Snowflake schema: {database}.{schema_name}")
 
         schema_metadata = SchemaMetadata(database=database, schema_name=schema_name)
@@ -59,25 +221,24 @@ class SnowflakeCrawler:
 
         logger.info(f"Found {len(tables)} tables in schema {database}.{schema_name}")
 
-        # Extract metadata for each table
-        for idx, table_row in enumerate(tables, 1):
-            table_name = table_row['TABLE_NAME']
-            logger.info(f"Processing table {idx}/{len(tables)}: {table_name}")
+        # One catalog query per view for the whole schema instead of
+        # several INFORMATION_SCHEMA queries per table
+        self._prefetch = self._prefetch_catalog(database, schema_name)
 
-            try:
-                table_metadata = self.extract_table_metadata(database, schema_name, table_name)
-                schema_metadata.tables.append(table_metadata)
-
-                # Extract sample data
-                self.extract_sample_data(database, schema_name, table_name, sample_size)
-
-                # Profile data
-                table_profile = self.profile_table_data(database, schema_name, table_name, table_metadata)
-                self.save_profile(table_profile)
-
-            except Exception as e:
-                logger.error(f"Failed to process table {table_name}: {e}")
-                continue
+        # Extract metadata for all tables in parallel; each table needs
+        # several round-trips, so overlapping them dominates wall time
+        table_names = [table_row['TABLE_NAME'] for table_row in tables]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for table_metadata in executor.map(
+                    lambda name: self._process_table(database, schema_name, name, sample_size),
+                    table_names
+                ):
+                    if table_metadata:
+                        schema_metadata.tables.append(table_metadata)
+        finally:
+            self._close_worker_connectors()
+            self._prefetch = None
 
         # Get list of views
         views_query = f"""
@@ -98,7 +259,7 @@ class SnowflakeCrawler:
 
         return schema_metadata
 
-    def extract_table_metadata(self, database: str, schema: str, table_name: str) -> TableMetadata:
+    def extract_table_metadata(self, database: str, schema: str, table_name: str, connector: SnowflakeConnector = None) -> TableMetadata:
         """
         Extract complete metadata for a specific table.
 
@@ -106,40 +267,52 @@ class SnowflakeCrawler:
             database: Database name
             schema: Schema name
             table_name: Table name
+            connector: Optional connector override (used by worker threads)
 
         Returns:
             TableMetadata object
         """
+        connector = connector or self.connector
+        prefetched = self._prefetch
         table_metadata = TableMetadata(schema=schema, table_name=table_name)
 
         # Get column information
-        columns_query = f"""
-            SELECT
-                COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
-                NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE,
-                COLUMN_DEFAULT, COMMENT, ORDINAL_POSITION
-            FROM {database}.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
-            ORDER BY ORDINAL_POSITION
-        """
-        columns = self.connector.execute_query(columns_query)
+        if prefetched is not None:
+            columns = prefetched['columns'].get(table_name, [])
+        else:
+            columns_query = f"""
+                SELECT
+                    COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+                    NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE,
+                    COLUMN_DEFAULT, COMMENT, ORDINAL_POSITION
+                FROM {database}.INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
+                ORDER BY ORDINAL_POSITION
+            """
+            columns = connector.execute_query(columns_query)
 
         # Get primary key columns
-        pk_query = f"""
-            SELECT kcu.COLUMN_NAME
-            FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
-                AND tc.TABLE_NAME = kcu.TABLE_NAME
-            WHERE tc.TABLE_SCHEMA = '{schema}'
-            AND tc.TABLE_NAME = '{table_name}'
-            AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-            ORDER BY kcu.ORDINAL_POSITION
-        """
-        pk_cols = self.connector.execute_query(pk_query)
-        pk_set = {col['COLUMN_NAME'] for col in pk_cols}
-        table_metadata.primary_keys = list(pk_set)
+        if prefetched is not None:
+            pk_cols = prefetched['pk_cols'].get(table_name, [])
+        else:
+            pk_query = f"""
+                SELECT kcu.COLUMN_NAME
+                FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+                JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                    AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+                    AND tc.TABLE_NAME = kcu.TABLE_NAME
+                WHERE tc.TABLE_SCHEMA = '{schema}'
+                AND tc.TABLE_NAME = '{table_name}'
+                AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+                ORDER BY kcu.ORDINAL_POSITION
+            """
+            pk_cols = connector.execute_query(pk_query)
+        # Keep the catalog's column order: composite key order matters
+        # for the generated DDL downstream
+        pk_list = [col['COLUMN_NAME'] for col in pk_cols]
+        pk_set = set(pk_list)
+        table_metadata.primary_keys = pk_list
 
         # Build column metadata
         for col in columns:
@@ -157,39 +330,37 @@ class SnowflakeCrawler:
             table_metadata.columns.append(col_metadata)
 
         # Get foreign keys
-        fk_query = f"""
-            SELECT
-                tc.CONSTRAINT_NAME,
-                kcu.COLUMN_NAME,
-                rc.UNIQUE_CONSTRAINT_NAME,
-                kcu2.TABLE_NAME AS REFERENCED_TABLE,
-                kcu2.COLUMN_NAME AS REFERENCED_COLUMN
-            FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-            JOIN {database}.INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
-                ON tc.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
-            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu2
-                ON rc.UNIQUE_CONSTRAINT_NAME = kcu2.CONSTRAINT_NAME
-            WHERE tc.TABLE_SCHEMA = '{schema}'
-            AND tc.TABLE_NAME = '{table_name}'
-            AND tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
-            ORDER BY tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
-        """
-        fks = self.connector.execute_query(fk_query)
+        if prefetched is not None:
+            fks = prefetched['fks'].get(table_name, [])
+        else:
+            fk_query = f"""
+                SELECT
+                    tc.CONSTRAINT_NAME,
+                    kcu.COLUMN_NAME,
+                    rc.UNIQUE_CONSTRAINT_NAME,
+                    kcu2.TABLE_NAME AS REFERENCED_TABLE,
+                    kcu2.COLUMN_NAME AS REFERENCED_COLUMN
+                FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+                JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                JOIN {database}.INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+                    ON tc.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+                JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu2
+                    ON rc.UNIQUE_CONSTRAINT_NAME = kcu2.CONSTRAINT_NAME
+                WHERE tc.TABLE_SCHEMA = '{schema}'
+                AND tc.TABLE_NAME = '{table_name}'
+                AND tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
+                ORDER BY tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+            """
+            fks = connector.execute_query(fk_query)
 
         # Group foreign keys by constraint name
-        fk_dict = {}
+        fk_dict = defaultdict(lambda: {'columns': [], 'ref_table': None, 'ref_columns': []})
         for fk in fks:
-            constraint_name = fk['CONSTRAINT_NAME']
-            if constraint_name not in fk_dict:
-                fk_dict[constraint_name] = {
-                    'columns': [],
-                    'ref_table': fk['REFERENCED_TABLE'],
-                    'ref_columns': []
-                }
-            fk_dict[constraint_name]['columns'].append(fk['COLUMN_NAME'])
-            fk_dict[constraint_name]['ref_columns'].append(fk['REFERENCED_COLUMN'])
+            entry = fk_dict[fk['CONSTRAINT_NAME']]
+            entry['ref_table'] = entry['ref_table'] or fk['REFERENCED_TABLE']
+            entry['columns'].append(fk['COLUMN_NAME'])
+            entry['ref_columns'].append(fk['REFERENCED_COLUMN'])
 
         for constraint_name, fk_info in fk_dict.items():
             fk_metadata = ConstraintMetadata(
@@ -202,12 +373,16 @@ class SnowflakeCrawler:
             table_metadata.foreign_keys.append(fk_metadata)
 
         # Get table statistics
-        stats_query = f"""
-            SELECT ROW_COUNT, BYTES, CREATED, LAST_ALTERED, COMMENT
-            FROM {database}.INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
-        """
-        stats = self.connector.execute_query(stats_query)
+        if prefetched is not None:
+            stats_row = prefetched['stats'].get(table_name)
+            stats = [stats_row] if stats_row else []
+        else:
+            stats_query = f"""
+                SELECT ROW_COUNT, BYTES, CREATED, LAST_ALTERED, COMMENT
+                FROM {database}.INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
+            """
+            stats = connector.execute_query(stats_query)
         if stats:
             table_metadata.row_count = stats[0]['ROW_COUNT'] or 0
             table_metadata.table_size_bytes = stats[0]['BYTES'] or 0
@@ -220,7 +395,7 @@ class SnowflakeCrawler:
         # Get clustering keys
         try:
             cluster_query = f"SHOW TABLES LIKE '{table_name}' IN {database}.{schema}"
-            self.connector.execute_query(cluster_query)
+            connector.execute_query(cluster_query)
             # Note: Snowflake's clustering key info requires parsing SHOW TABLES output
             # This is a simplified version
         except Exception as e:
@@ -228,34 +403,66 @@ class SnowflakeCrawler:
 
         return table_metadata
 
-    def extract_sample_data(self, database: str, schema: str, table_name: str, sample_size: int = 100) -> None:
+    def extract_sample_data(self, database: str, schema: str, table_name: str, sample_size: int = 100, connector: SnowflakeConnector = None) -> Optional[pd.DataFrame]:
         """
-        Extract sample data from a table and save to CSV.
+        Extract sample data from a table and save in the configured format.
 
         Args:
             database: Database name
             schema: Schema name
             table_name: Table name
             sample_size: Number of rows to sample
-        """
-        try:
-            query = f'SELECT * FROM {database}.{schema}.{table_name} LIMIT {sample_size}'
-            results = self.connector.execute_query(query)
-
-            if results:
-                # Convert to pandas DataFrame for easier CSV writing
-                df = pd.DataFrame(results)
+            connector: Optional connector override (used by worker threads)
 
-                # Save to CSV
-                output_file = self.output_dir / f"snowflake_{database}_{schema}_{table_name}_sample.csv"
-                df.to_csv(output_file, index=False)
+        Returns:
+            The first few fetched rows for reuse by profiling, or None
+            when no rows were fetched locally
+        """
+        connector = connector or self.connector
+        qualified = f'{self._q(database)}.{self._q(schema)}.{self._q(table_name)}'
+
+        if self.sample_format == 'parquet':
+            # Snowflake serializes and compresses the sample server-side;
+            # the client just downloads one parquet file instead of
+            # converting every cell through the driver and pandas
+            stage_path = f'@~/dwmig/{database}_{schema}_{table_name}.parquet'
+            try:
+                connector.cursor.execute(
+                    f"COPY INTO {stage_path} FROM (SELECT * FROM {qualified} LIMIT {sample_size}) "
+                    f"FILE_FORMAT = (TYPE = PARQUET) HEADER = TRUE OVERWRITE = TRUE SINGLE = TRUE"
+                )
+                connector.cursor.execute(f"GET {stage_path} 'file://{self.output_dir}'")
+                connector.cursor.execute(f"REMOVE {stage_path}")
+                logger.debug(f"Sample data downloaded for {qualified}")
+            except Exception as e:
+                logger.warning(f"Could not extract sample data for {database}.{schema}.{table_name}: {e}")
+            return None
 
+        try:
+            query = f'SELECT * FROM {qualified} LIMIT {sample_size}'
+
+            # Stream Arrow-backed batches straight to CSV; avoids building
+            # a dict per row and keeps memory bounded for large samples
+            connector.cursor.execute(query)
+            output_file = self._out_prefix + f"{database}_{schema}_{table_name}_sample.csv"
+            first = True
+            head = None
+            for df in connector.cursor.fetch_pandas_batches():
+                if first:
+                    head = df.head(5)
+                df.to_csv(output_file, mode='w' if first else 'a', header=first, index=False)
+                first = False
+
+            if not first:
                 logger.debug(f"Sample data saved: {output_file}")
+            return head
 
         except Exception as e:
             logger.warning(f"Could not extract sample data for {database}.{schema}.{table_name}: {e}")
 
-    def profile_table_data(self, database: str, schema: str, table_name: str, table_metadata: TableMetadata) -> TableProfile:
+        return None
+
+    def profile_table_data(self, database: str, schema: str, table_name: str, table_metadata: TableMetadata, connector: SnowflakeConnector = None, sample: Optional[pd.DataFrame] = None) -> TableProfile:
         """
         Profile table data to get statistics.
 
@@ -264,63 +471,148 @@ class SnowflakeCrawler:
             schema: Schema name
             table_name: Table name
             table_metadata: Table metadata
+            connector: Optional connector override (used by worker threads)
+            sample: Optional sample rows from extract_sample_data
 
         Returns:
             TableProfile object
         """
+        connector = connector or self.connector
         profile = TableProfile(schema=schema, table_name=table_name, row_count=table_metadata.row_count)
 
         if table_metadata.row_count == 0:
             return profile
 
+        if table_metadata.row_count <= self.profile_row_threshold:
+            # Small tables are cheaper to pull once and profile locally
+            # than to aggregate through the planner
+            self._profile_locally(database, schema, table_name, table_metadata, connector, profile)
+        else:
+            self._profile_with_queries(database, schema, table_name, table_metadata, connector, profile)
+
+        # Seed sample values from the rows extract_sample_data already
+        # fetched; a dedicated 5-row fetch is only needed without them
+        try:
+            samples = sample
+            if samples is None:
+                sample_query = f'SELECT * FROM {self._q(database)}.{self._q(schema)}.{self._q(table_name)} LIMIT 5'
+                samples = connector.execute_arrow(sample_query)
+            if not samples.empty:
+                for col_profile in profile.column_profiles:
+                    if col_profile.column_name not in samples.columns:
+                        continue
+                    col_values = samples[col_profile.column_name].dropna()
+                    col_profile.sample_values = sorted({str(s) for s in col_values})
+        except Exception as e:
+            logger.debug(f"Could not collect sample values for {database}.{schema}.{table_name}: {e}")
+
+        return profile
+
+    def _profile_locally(self, database: str, schema: str, table_name: str, table_metadata: TableMetadata,
+                         connector: SnowflakeConnector, profile: TableProfile) -> None:
+        """Profile a small table from a single Arrow fetch.
+
+        One round-trip plus vectorized pandas aggregation beats running
+        aggregate scans through the planner when the table is tiny.
+        """
+        try:
+            df = connector.execute_arrow(f'SELECT * FROM {self._q(database)}.{self._q(schema)}.{self._q(table_name)}')
+        except Exception as e:
+            logger.debug(f"Could not fetch {database}.{schema}.{table_name} for local profiling: {e}")
+            return
+
+        if df.empty:
+            return
+
+        row_count = len(df)
+        null_counts = df.isna().sum()
+        distinct_counts = df.nunique()
+
         for column in table_metadata.columns:
-            try:
-                # Get column statistics
-                stats_query = f"""
-                    SELECT
-                        COUNT(*) - COUNT({column.name}) as NULL_COUNT,
-                        COUNT(DISTINCT {column.name}) as DISTINCT_COUNT
-                    FROM {database}.{schema}.{table_name}
-                """
-
-                stats = self.connector.execute_query(stats_query)
-
-                if stats:
-                    null_count = stats[0]['NULL_COUNT']
-                    distinct_count = stats[0]['DISTINCT_COUNT']
-
-                    col_profile = DataProfile(
-                        column_name=column.name,
-                        null_count=null_count,
-                        null_percentage=(null_count / table_metadata.row_count * 100) if table_metadata.row_count > 0 else 0,
-                        distinct_count=distinct_count
-                    )
-
-                    # Get min/max for numeric and date columns
-                    if column.data_type in ('NUMBER', 'INTEGER', 'FLOAT', 'DATE', 'TIMESTAMP', 'TIMESTAMP_NTZ', 'TIMESTAMP_LTZ', 'TIMESTAMP_TZ'):
-                        minmax_query = f"SELECT MIN({column.name}), MAX({column.name}), AVG({column.name}) FROM {database}.{schema}.{table_name}"
-                        try:
-                            minmax = self.connector.execute_query(minmax_query)
-                            if minmax:
-                                col_profile.min_value = str(minmax[0]['MIN(' + column.name + ')']) if minmax[0]['MIN(' + column.name + ')'] else None
-                                col_profile.max_value = str(minmax[0]['MAX(' + column.name + ')']) if minmax[0]['MAX(' + column.name + ')'] else None
-                                if 'AVG(' + column.name + ')' in minmax[0]:
-                                    col_profile.avg_value = str(minmax[0]['AVG(' + column.name + ')'])
-                        except:
-                            pass
-
-                    # Get sample values (top 5)
-                    sample_query = f"SELECT DISTINCT {column.name} FROM {database}.{schema}.{table_name} WHERE {column.name} IS NOT NULL LIMIT 5"
-                    samples = self.connector.execute_query(sample_query)
-                    col_profile.sample_values = [str(list(s.values())[0]) for s in samples]
-
-                    profile.column_profiles.append(col_profile)
+            name = column.name
+            if name not in df.columns:
+                continue
+
+            null_count = int(null_counts[name])
+            col_profile = DataProfile(
+                column_name=name,
+                null_count=null_count,
+                null_percentage=(null_count / row_count * 100) if row_count > 0 else 0,
+                distinct_count=int(distinct_counts[name])
+            )
+
+            series = df[name].dropna()
+            if not series.empty:
+                if column.data_type in self.MINMAX_TYPES:
+                    col_profile.min_value = str(series.min())
+                    col_profile.max_value = str(series.max())
+                if column.data_type in self.AVG_TYPES:
+                    col_profile.avg_value = str(series.mean())
+
+            profile.column_profiles.append(col_profile)
+
+    def _profile_with_queries(self, database: str, schema: str, table_name: str, table_metadata: TableMetadata,
+                              connector: SnowflakeConnector, profile: TableProfile) -> None:
+        """Profile columns with chunked single-scan aggregate queries."""
+        minmax_types = self.MINMAX_TYPES
+        avg_types = self.AVG_TYPES
+
+        # Compute all column aggregates in one scan per chunk instead of
+        # 2-3 full-table queries per column. Chunked to keep the select
+        # list bounded on very wide tables.
+        chunk_size = self.PROFILE_CHUNK_SIZE
+        columns = table_metadata.columns
+        for start in range(0, len(columns), chunk_size):
+            chunk = columns[start:start + chunk_size]
+
+            agg_parts = []
+            for i, column in enumerate(chunk, start):
+                col = self._q(column.name)
+                agg_parts.append(f"COUNT(*) - COUNT({col}) AS NULL_{i}")
+                # HyperLogLog is 5-50x cheaper than an exact distinct and
+                # well within tolerance for migration planning
+                if self.approx_distinct:
+                    agg_parts.append(f"APPROX_COUNT_DISTINCT({col}) AS DIST_{i}")
+                else:
+                    agg_parts.append(f"COUNT(DISTINCT {col}) AS DIST_{i}")
+                if column.data_type in minmax_types:
+                    agg_parts.append(f"MIN({col}) AS MIN_{i}")
+                    agg_parts.append(f"MAX({col}) AS MAX_{i}")
+                if column.data_type in avg_types:
+                    agg_parts.append(f"AVG({col}) AS AVG_{i}")
+
+            stats_query = f"SELECT {', '.join(agg_parts)} FROM {self._q(database)}.{self._q(schema)}.{self._q(table_name)}"
 
+            try:
+                stats = connector.execute_query(stats_query)
             except Exception as e:
-                logger.debug(f"Could not profile column {column.name}: {e}")
+                logger.debug(f"Could not profile columns of {database}.{schema}.{table_name}: {e}")
                 continue
 
-        return profile
+            if not stats:
+                continue
+
+            row = stats[0]
+            for i, column in enumerate(chunk, start):
+                null_count = row[f'NULL_{i}']
+
+                col_profile = DataProfile(
+                    column_name=column.name,
+                    null_count=null_count,
+                    null_percentage=(null_count / table_metadata.row_count * 100) if table_metadata.row_count > 0 else 0,
+                    distinct_count=row[f'DIST_{i}']
+                )
+
+                if column.data_type in minmax_types:
+                    min_value = row[f'MIN_{i}']
+                    max_value = row[f'MAX_{i}']
+                    col_profile.min_value = str(min_value) if min_value is not None else None
+                    col_profile.max_value = str(max_value) if max_value is not None else None
+                if column.data_type in avg_types:
+                    avg_value = row[f'AVG_{i}']
+                    col_profile.avg_value = str(avg_value) if avg_value is not None else None
+
+                profile.column_profiles.append(col_profile)
 
     def save_profile(self, profile: TableProfile) -> None:
         """
@@ -329,10 +621,11 @@ class SnowflakeCrawler:
         Args:
             profile: TableProfile object
         """
-        output_file = self.output_dir / f"snowflake_{profile.schema}_{profile.table_name}_profile.json"
-        import json
-        with open(output_file, 'w') as f:
-            json.dump(profile.to_dict(), f, indent=2, default=str)
+        output_file = self._out_prefix + f"{profile.schema}_{profile.table_name}_profile.json"
+        # orjson encodes in C; one profile is written per table, so the
+        # stdlib encoder shows up at schema scale
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(profile.to_dict(), option=orjson.OPT_INDENT_2, default=str))
 
     def crawl_multiple_schemas(self, database: str, schema_names: List[str], sample_size: int = 100) -> List[SchemaMetadata]:
         """
@@ -346,16 +639,21 @@ class SnowflakeCrawler:
         Returns:
             List of SchemaMetadata objects
         """
-        schemas = []
-        for schema_name in schema_names:
-            try:
-                schema_metadata = self.crawl_schema(database, schema_name, sample_size)
-                schemas.append(schema_metadata)
-            except Exception as e:
-                logger.error(f"Failed to crawl schema {schema_name}: {e}")
-                continue
-
-        return schemas
+        # Schemas fan out across processes: each owns its connection and
+        # the CPU-bound JSON/CSV encoding escapes the GIL
+        crawler_kwargs = {
+            'max_workers': self.max_workers,
+            'approx_distinct': self.approx_distinct,
+            'sample_format': self.sample_format,
+            'profile_row_threshold': self.profile_row_threshold,
+        }
+        worker = partial(
+            _crawl_schema_process,
+            self.connector.config, str(self.output_dir), database,
+            sample_size=sample_size, crawler_kwargs=crawler_kwargs
+        )
+        with ProcessPoolExecutor(max_workers=self.schema_workers) as executor:
+            return [schema for schema in executor.map(worker, schema_names) if schema]
 
     def list_databases(self) -> List[str]:
         """
@@ -381,3 +679,20 @@ class SnowflakeCrawler:
         query = f"SHOW SCHEMAS IN DATABASE {database}"
         results = self.connector.execute_query(query)
         return [row['name'] for row in results]
+
+
+def _crawl_schema_process(config: Dict[str, Any], output_dir: str, database: str, schema_name: str,
+                          sample_size: int = 100, crawler_kwargs: Dict[str, Any] = None) -> Optional[SchemaMetadata]:
+    """Crawl one schema inside a worker process.
+
+    Lives at module level so it is picklable; connectors hold live
+    sockets and cannot cross process boundaries, so each worker opens
+    its own connection from the shared config.
+    """
+    try:
+        with SnowflakeConnector(config) as connector:
+            crawler = SnowflakeCrawler(connector, output_dir=output_dir, **(crawler_kwargs or {}))
+            return crawler.crawl_schema(database, schema_name, sample_size)
+    except Exception as e:
+        logger.error(f"Failed to crawl schema {schema_name}: {e}")
+        return None
@@ -1,16 +1,30 @@
 """
 Snowflake stored procedure generator from Informatica mappings.
 """
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from jinja2 import Template
 from loguru import logger
+import orjson
 
 from .sql_translator import SQLTranslator
 from ..parsers.informatica_xml_parser import InformaticaMapping
 from ..crawlers.metadata_models import TableMetadata, ColumnMetadata
 
+# The parser interns port types and property names; interning our side
+# of each comparison lets string equality short-circuit on identity
+_OUTPUT = sys.intern('OUTPUT')
+_GROUP = sys.intern('GROUP')
+_FILTER_CONDITION = sys.intern('FILTER_CONDITION')
+
 
 class StoredProcedureGenerator:
     """Generate Snowflake stored procedures from Informatica mappings."""
@@ -69,14 +83,14 @@ BEGIN
 
         -- Main MERGE/INSERT Logic
         -- ============================================
-{{ merge_logic | indent(8) }}
+{{ merge_logic }}
         -- ============================================
 
         -- Get row counts
         GET DIAGNOSTICS V_ROWS_INSERTED = ROW_COUNT;
 
         -- Data quality checks
-{{ quality_checks | indent(8) }}
+{{ quality_checks }}
 
     EXCEPTION
         WHEN OTHER THEN
@@ -118,39 +132,100 @@ $$;
 """
 
     MERGE_TEMPLATE = """MERGE INTO {{ target_schema }}.{{ target_table }} TGT
-USING (
-    SELECT
-{{ select_columns | indent(12) }}
-    FROM {{ source_schema }}.{{ source_table }} SRC
-{{ join_clauses | indent(4) }}
-{{ where_clause | indent(4) }}
-{{ group_by_clause | indent(4) }}
-) SRC
-ON {{ merge_condition }}
-WHEN MATCHED THEN
-    UPDATE SET
-{{ update_columns | indent(8) }}
-WHEN NOT MATCHED THEN
-    INSERT (
-{{ insert_columns | indent(8) }}
-    )
-    VALUES (
-{{ insert_values | indent(8) }}
-    );"""
-
-    def __init__(self, output_dir: str = "output/stored_procedures", schema: str = "PUBLIC"):
+        USING (
+            SELECT
+        {{ select_columns | indent(20) }}
+            FROM {{ source_schema }}.{{ source_table }} SRC
+        {{ join_clauses | indent(12) }}
+        {{ where_clause | indent(12) }}
+        {{ group_by_clause | indent(12) }}
+        ) SRC
+        ON {{ merge_condition }}
+        WHEN MATCHED THEN
+            UPDATE SET
+        {{ update_columns | indent(16) }}
+        WHEN NOT MATCHED THEN
+            INSERT (
+        {{ insert_columns | indent(16) }}
+            )
+            VALUES (
+        {{ insert_values | indent(16) }}
+            );"""
+
+    # Documentation template; rendered once over all generated
+    # procedures instead of hand-assembling markdown per entry
+    DOC_TEMPLATE = """# Stored Procedure Documentation
+
+Generated: {{ generated_date }}
+
+{% for p in procs -%}
+## {{ p.name }}
+
+**Target Table:** {{ p.target }}
+**Source Mapping:** {{ p.mapping }}
+**File:** {{ p.file_name }}
+
+### Parameters
+- `P_LOAD_DATE` (DATE): Load date for the data (default: CURRENT_DATE)
+- `P_BATCH_ID` (VARCHAR): Batch identifier (default: auto-generated)
+- `P_DEBUG_MODE` (BOOLEAN): Enable debug logging (default: FALSE)
+
+### Returns
+OBJECT containing:
+- `STATUS`: Execution status (SUCCESS/FAILED)
+- `ROWS_INSERTED`: Number of rows inserted
+- `ROWS_UPDATED`: Number of rows updated
+- `ROWS_DELETED`: Number of rows deleted
+- `ERROR_MESSAGE`: Error message if failed
+- `EXECUTION_TIME_SECONDS`: Total execution time
+- `BATCH_ID`: Batch identifier
+
+### Usage
+```sql
+CALL {{ p.call_schema }}.{{ p.name }}(
+    P_LOAD_DATE => '2025-11-16'::DATE,
+    P_DEBUG_MODE => TRUE
+);
+```
+
+{% endfor %}"""
+
+    # Output directories already created this process; callers often
+    # build one generator per mapping, and re-running mkdir would cost
+    # a stat syscall each time
+    _ensured_dirs = set()
+
+    def __init__(
+        self,
+        output_dir: str = "output/stored_procedures",
+        schema: str = "PUBLIC",
+        incremental: bool = True
+    ):
         """
         Initialize stored procedure generator.
 
         Args:
             output_dir: Directory to save generated procedures
             schema: Target Snowflake schema
+            incremental: Skip rewriting .sql files whose rendered content
+                is unchanged, so mtimes (and downstream diff/deploy
+                tooling) only move for real changes
         """
+        _init_templates()
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if output_dir not in StoredProcedureGenerator._ensured_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            StoredProcedureGenerator._ensured_dirs.add(output_dir)
         self.schema = schema
+        self.incremental = incremental
         self.sql_translator = SQLTranslator()
         self.generated_procedures = []
+        self._cache_dir = self.output_dir / ".cache"
+        self._manifest = self._load_manifest()
+        # One timestamp per generator run; every generated artifact of a
+        # bulk run carries the same header instead of paying
+        # clock_gettime + strftime per output
+        self._run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     def generate_from_mapping(
         self,
@@ -169,6 +244,43 @@ WHEN NOT MATCHED THEN
         """
         logger.info(f"Generating stored procedure for mapping: {informatica_mapping.name}")
 
+        # Rendering is deterministic in (mapping, target metadata,
+        # schema); a fingerprint hit means the file on disk is already
+        # the right output, so translation and rendering are skipped
+        fingerprint = self._mapping_fingerprint(informatica_mapping, target_table_metadata)
+        cached_file = self._manifest.get(fingerprint) if self.incremental else None
+        if cached_file and Path(cached_file).exists():
+            return self._register_cached(informatica_mapping, cached_file)
+
+        rendered = self._render_mapping(informatica_mapping, target_table_metadata)
+        if rendered is None:
+            return None
+
+        return self._write_procedure(informatica_mapping, fingerprint, rendered)
+
+    def _register_cached(self, informatica_mapping: InformaticaMapping, cached_file: str) -> str:
+        """Record a manifest hit as a generated procedure."""
+        logger.info(f"Mapping unchanged, reusing: {cached_file}")
+        self.generated_procedures.append({
+            'name': Path(cached_file).stem,
+            'file': cached_file,
+            'mapping': informatica_mapping.name,
+            'target': f"{self.schema}.{informatica_mapping.targets[0].name}"
+                      if informatica_mapping.targets else None
+        })
+        return cached_file
+
+    def _render_mapping(
+        self,
+        informatica_mapping: InformaticaMapping,
+        target_table_metadata: TableMetadata = None
+    ) -> Optional[Tuple[str, str, str, str]]:
+        """Render a mapping to SQL without touching the filesystem.
+
+        Returns:
+            Tuple of (procedure_name, target_schema, target_table,
+            rendered SQL), or None if the mapping has no source or target
+        """
         # Determine target table
         if informatica_mapping.targets:
             target = informatica_mapping.targets[0]
@@ -216,26 +328,45 @@ WHEN NOT MATCHED THEN
             target_table_metadata
         )
 
-        # Render template
-        template = Template(self.SP_TEMPLATE)
-        proc_sql = template.render(
+        # Render through the partially evaluated skeleton: the SQL frame
+        # is constant, so only the variable slots are substituted
+        proc_sql = _render_sp(
             procedure_name=procedure_name,
             schema=target_schema,
             description=informatica_mapping.description or f"Load {target_table}",
             source_mapping=informatica_mapping.name,
-            generated_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            generated_date=self._run_timestamp,
             source_system='Oracle',
             target_system='Snowflake',
             merge_logic=merge_logic,
             quality_checks=quality_checks
         )
 
-        # Save to file
-        output_file = self.output_dir / f"{procedure_name}.sql"
-        with open(output_file, 'w') as f:
-            f.write(proc_sql)
+        return procedure_name, target_schema, target_table, proc_sql
 
-        logger.info(f"Generated procedure: {output_file}")
+    def _write_procedure(
+        self,
+        informatica_mapping: InformaticaMapping,
+        fingerprint: str,
+        rendered: Tuple[str, str, str, str]
+    ) -> str:
+        """Write a rendered procedure to disk and register it."""
+        procedure_name, target_schema, target_table, proc_sql = rendered
+
+        # Save to file, unless the content is unchanged from last run
+        output_file = self.output_dir / f"{procedure_name}.sql"
+        if self.incremental and self._is_unchanged(output_file, proc_sql):
+            logger.info(f"Procedure unchanged, skipping write: {output_file}")
+        else:
+            # Binary write of a pre-encoded buffer: one encode, one
+            # syscall, no text-mode encoder in between. Written to a
+            # temp file and renamed so consumers never observe a
+            # truncated procedure and mtimes only move on a real write
+            tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(proc_sql.encode('utf-8'))
+            os.replace(tmp_file, output_file)
+            logger.info(f"Generated procedure: {output_file}")
         self.generated_procedures.append({
             'name': procedure_name,
             'file': str(output_file),
@@ -243,8 +374,104 @@ WHEN NOT MATCHED THEN
             'target': f"{target_schema}.{target_table}"
         })
 
+        self._manifest[fingerprint] = str(output_file)
+        self._save_manifest()
+
         return str(output_file)
 
+    def generate_from_mappings(self, mappings: List[InformaticaMapping]) -> List[Optional[str]]:
+        """
+        Generate stored procedures for many mappings in parallel.
+
+        Rendering (SQL translation plus template work) is CPU-bound and
+        independent per mapping, so it fans out across processes; the
+        parent process keeps all file writes, manifest updates and
+        registration so shared state stays single-writer.
+
+        Args:
+            mappings: InformaticaMapping objects to generate from
+
+        Returns:
+            List of output paths, in input order (None where a mapping
+            had no usable source or target)
+        """
+        results: List[Optional[str]] = [None] * len(mappings)
+        pending = []
+
+        for idx, mapping in enumerate(mappings):
+            fingerprint = self._mapping_fingerprint(mapping, None)
+            cached_file = self._manifest.get(fingerprint) if self.incremental else None
+            if cached_file and Path(cached_file).exists():
+                results[idx] = self._register_cached(mapping, cached_file)
+            else:
+                pending.append((idx, mapping, fingerprint))
+
+        if pending:
+            worker = partial(_render_mapping_process, str(self.output_dir), self.schema)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                rendered = list(executor.map(
+                    worker,
+                    [mapping for _, mapping, _ in pending],
+                    chunksize=8
+                ))
+
+            for (idx, mapping, fingerprint), result in zip(pending, rendered):
+                if result is not None:
+                    results[idx] = self._write_procedure(mapping, fingerprint, result)
+
+        return results
+
+    def _mapping_fingerprint(
+        self,
+        mapping: InformaticaMapping,
+        target_metadata: TableMetadata = None
+    ) -> str:
+        """Fingerprint everything the rendered SQL depends on."""
+        payload = pickle.dumps((
+            mapping.to_dict(),
+            target_metadata.to_dict() if target_metadata else None,
+            self.schema
+        ))
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """Load the fingerprint-to-file manifest from a previous run."""
+        manifest_file = self._cache_dir / "manifest.json"
+        if manifest_file.exists():
+            try:
+                return orjson.loads(manifest_file.read_bytes())
+            except (orjson.JSONDecodeError, OSError):
+                logger.warning(f"Discarding unreadable manifest: {manifest_file}")
+        return {}
+
+    def _save_manifest(self) -> None:
+        """Persist the fingerprint-to-file manifest for the next run."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Rename-into-place so a crash mid-write cannot leave a corrupt
+        # manifest that would break the next incremental run
+        manifest_file = self._cache_dir / "manifest.json"
+        tmp_file = manifest_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(orjson.dumps(self._manifest))
+        os.replace(tmp_file, manifest_file)
+
+    @staticmethod
+    def _is_unchanged(output_file: Path, rendered_sql: str) -> bool:
+        """Check whether an existing file already holds this rendering.
+
+        The '-- Generated:' header carries a timestamp that differs on
+        every run, so it is excluded from the comparison on both sides.
+        """
+        if not output_file.exists():
+            return False
+
+        def _stable(text: str) -> List[str]:
+            return [
+                line for line in text.splitlines()
+                if not line.startswith('-- Generated:')
+            ]
+
+        return _stable(output_file.read_text()) == _stable(rendered_sql)
+
     def _extract_query_components(
         self,
         mapping: InformaticaMapping
@@ -258,41 +485,25 @@ WHEN NOT MATCHED THEN
         Returns:
             Tuple of (select_columns, join_clauses, where_clause, group_by)
         """
-        select_columns = []
-        join_clauses = []
-        where_clause = ""
-        group_by = ""
-
-        # Extract columns from transformations
+        state = {
+            'select_columns': [],
+            'join_clauses': [],
+            'where_clause': "",
+            'group_by': ""
+        }
+
+        # Name index built once: joiner handling would otherwise scan
+        # the transformation list per join, quadratic on join-heavy maps
+        state['trans_by_name'] = {t.name: t for t in mapping.transformations}
+
+        # Dispatch on the uppercased type once per transformation: one
+        # hash lookup instead of walking an elif ladder of string compares
         for trans in mapping.transformations:
-            if trans.type.upper() in ['EXPRESSION', 'EXPRESSION TRANSFORMER']:
-                for port in trans.ports:
-                    if port.get('port_type') == 'OUTPUT':
-                        expr = self.sql_translator.translate_expression(
-                            port.get('expression', port['name'])
-                        )
-                        if expr:
-                            select_columns.append(f"{expr} AS {port['name']}")
-                        else:
-                            select_columns.append(f"{port['name']}")
-
-            elif trans.type.upper() == 'FILTER':
-                # Extract filter condition
-                for prop, value in trans.properties.items():
-                    if prop.upper() == 'FILTER_CONDITION':
-                        where_clause = self.sql_translator.translate_expression(value)
-
-            elif trans.type.upper() in ['JOINER', 'JOIN']:
-                # Extract join condition from connectors
-                join_sql = self._extract_join_logic(mapping, trans.name)
-                if join_sql:
-                    join_clauses.append(join_sql)
-
-            elif trans.type.upper() == 'AGGREGATOR':
-                # Extract group by columns
-                for port in trans.ports:
-                    if port.get('port_type') == 'GROUP':
-                        group_by += f", {port['name']}" if group_by else port['name']
+            handler = self._TRANS_HANDLERS.get(trans.type.upper())
+            if handler:
+                handler(self, trans, mapping, state)
+
+        select_columns = state['select_columns']
 
         # Default to source columns if no expressions found
         if not select_columns and mapping.sources:
@@ -300,12 +511,63 @@ WHEN NOT MATCHED THEN
             for col in source.columns:
                 select_columns.append(col['name'])
 
-        return select_columns, join_clauses, where_clause, group_by
+        return select_columns, state['join_clauses'], state['where_clause'], state['group_by']
 
-    def _extract_join_logic(self, mapping: InformaticaMapping, join_name: str) -> str:
+    def _collect_select_columns(self, trans, mapping, state) -> None:
+        """Collect translated output-port expressions as select columns."""
+        output_ports = [p for p in trans.ports if p.get('port_type') == _OUTPUT]
+        if not output_ports:
+            return
+
+        # One bulk call per transformation: the translator skips its
+        # per-call logging and batches wide mappings across cores
+        translated = self.sql_translator.translate_expressions_bulk(
+            [(port.get('expression', port['name']), port['name']) for port in output_ports]
+        )
+
+        select_columns = state['select_columns']
+        for port, expr in zip(output_ports, translated):
+            if expr:
+                select_columns.append(f"{expr} AS {port['name']}")
+            else:
+                select_columns.append(f"{port['name']}")
+
+    def _collect_where_clause(self, trans, mapping, state) -> None:
+        """Collect the translated filter condition."""
+        for prop, value in trans.properties.items():
+            if prop.upper() == _FILTER_CONDITION:
+                state['where_clause'] = self.sql_translator.translate_expression(value)
+
+    def _collect_join_clause(self, trans, mapping, state) -> None:
+        """Collect the join clause derived from a joiner transformation."""
+        join_sql = self._extract_join_logic(state['trans_by_name'], trans.name)
+        if join_sql:
+            state['join_clauses'].append(join_sql)
+
+    def _collect_group_by(self, trans, mapping, state) -> None:
+        """Collect group-by columns from aggregator ports."""
+        for port in trans.ports:
+            if port.get('port_type') == _GROUP:
+                if state['group_by']:
+                    state['group_by'] += f", {port['name']}"
+                else:
+                    state['group_by'] = port['name']
+
+    # Transformation-type dispatch; values are the plain functions, so
+    # callers pass self explicitly
+    _TRANS_HANDLERS = {
+        'EXPRESSION': _collect_select_columns,
+        'EXPRESSION TRANSFORMER': _collect_select_columns,
+        'FILTER': _collect_where_clause,
+        'JOINER': _collect_join_clause,
+        'JOIN': _collect_join_clause,
+        'AGGREGATOR': _collect_group_by,
+    }
+
+    def _extract_join_logic(self, trans_by_name: Dict[str, Any], join_name: str) -> str:
         """Extract JOIN logic from mapping."""
         # Find join transformation
-        join_trans = next((t for t in mapping.transformations if t.name == join_name), None)
+        join_trans = trans_by_name.get(join_name)
 
         if not join_trans:
             return None
@@ -342,26 +604,17 @@ WHEN NOT MATCHED THEN
         where_str = f"WHERE {where_clause}" if where_clause else ""
         group_by_str = f"GROUP BY {group_by}" if group_by else ""
 
-        # Build update set clause
-        update_cols = []
-        for col in select_columns:
-            col_name = col.split(' AS ')[-1].strip() if ' AS ' in col else col.split()[-1]
-            if col_name != merge_key:
-                update_cols.append(f"{col_name} = SRC.{col_name}")
+        # Parse each column's alias exactly once, then derive the
+        # update, insert and values clauses from the shared name list
+        col_names = [self._column_alias(col) for col in select_columns]
 
+        update_cols = [f"{name} = SRC.{name}" for name in col_names if name != merge_key]
         update_str = ",\n".join(update_cols) if update_cols else ""
 
-        # Build insert columns
-        insert_cols = []
-        for col in select_columns:
-            col_name = col.split(' AS ')[-1].strip() if ' AS ' in col else col.split()[-1]
-            insert_cols.append(col_name)
+        insert_cols_str = ",\n".join(col_names)
+        insert_vals_str = ",\n".join([f"SRC.{name}" for name in col_names])
 
-        insert_cols_str = ",\n".join(insert_cols)
-        insert_vals_str = ",\n".join([f"SRC.{col}" for col in insert_cols])
-
-        merge_template = Template(self.MERGE_TEMPLATE)
-        merge_sql = merge_template.render(
+        merge_sql = _MERGE_COMPILED.render(
             target_schema=target_schema,
             target_table=target_table,
             source_schema=source_schema,
@@ -378,6 +631,16 @@ WHEN NOT MATCHED THEN
 
         return merge_sql
 
+    @staticmethod
+    def _column_alias(col: str) -> str:
+        """Extract the output column name from an 'expr AS alias' entry.
+
+        rpartition scans once without allocating a split list; entries
+        without an alias fall back to their last whitespace token.
+        """
+        _, sep, alias = col.rpartition(' AS ')
+        return alias.strip() if sep else col.rsplit(None, 1)[-1]
+
     def _build_quality_checks(
         self,
         target_schema: str,
@@ -385,21 +648,22 @@ WHEN NOT MATCHED THEN
         target_metadata: TableMetadata = None
     ) -> str:
         """Build data quality checks."""
-        quality_checks = f"""-- Validate NOT NULL columns
-        SELECT COUNT(*) INTO V_ERROR_MESSAGE
-        FROM {target_schema}.{target_table}
-        WHERE 1=1"""
-
-        if target_metadata:
-            for col in target_metadata.columns:
-                if not col.nullable:
-                    quality_checks += f"\n        AND {col.name} IS NOT NULL"
-
-        quality_checks += f"""
-        GROUP BY 1
-        HAVING COUNT(*) = 0;"""
-
-        return quality_checks
+        # Build the AND clauses in one join rather than growing a string
+        # with += per column, which recopies the accumulator each time.
+        # The 8-space SP-body indent is baked into the separators so the
+        # block splices into the procedure frame without an indent pass
+        and_clauses = "".join(
+            f"\n                AND {col.name} IS NOT NULL"
+            for col in target_metadata.columns
+            if not col.nullable
+        ) if target_metadata else ""
+
+        return f"""-- Validate NOT NULL columns
+                SELECT COUNT(*) INTO V_ERROR_MESSAGE
+                FROM {target_schema}.{target_table}
+                WHERE 1=1{and_clauses}
+                GROUP BY 1
+                HAVING COUNT(*) = 0;"""
 
     def generate_deployment_script(self) -> str:
         """
@@ -410,32 +674,35 @@ WHEN NOT MATCHED THEN
         """
         logger.info("Generating deployment script")
 
-        deployment_script = "-- Snowflake Migration - Stored Procedure Deployment Script\n"
-        deployment_script += f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        deployment_script += f"-- Total Procedures: {len(self.generated_procedures)}\n\n"
-
-        deployment_script += "USE ROLE SYSADMIN;\n\n"
-
-        for proc_info in self.generated_procedures:
-            deployment_script += f"-- Deploy: {proc_info['name']}\n"
-            with open(proc_info['file'], 'r') as f:
-                deployment_script += f.read()
-            deployment_script += "\n\n"
-
-        # Add execution script
-        deployment_script += "-- Execute Procedures\n"
-        deployment_script += "-- " + "=" * 50 + "\n\n"
-
-        for proc_info in self.generated_procedures:
-            deployment_script += f"CALL {proc_info['target'].split('.')[0]}.{proc_info['name']}(\n"
-            deployment_script += "    P_LOAD_DATE => CURRENT_DATE(),\n"
-            deployment_script += "    P_DEBUG_MODE => TRUE\n"
-            deployment_script += ");\n\n"
-
-        # Save deployment script
         output_file = self.output_dir / "00_DEPLOYMENT.sql"
-        with open(output_file, 'w') as f:
-            f.write(deployment_script)
+
+        # Stream straight to disk: the script embeds every generated
+        # procedure, so assembling it in memory scales with the sum of
+        # all file sizes. A 1 MiB buffer keeps syscalls batched.
+        # Binary mode end to end: procedure files are copied raw and the
+        # generated text is encoded once per write, skipping the
+        # text-mode encoder entirely
+        with open(output_file, 'wb', buffering=1 << 20) as out:
+            out.write(b"-- Snowflake Migration - Stored Procedure Deployment Script\n")
+            out.write(f"-- Generated: {self._run_timestamp}\n".encode('utf-8'))
+            out.write(f"-- Total Procedures: {len(self.generated_procedures)}\n\n".encode('utf-8'))
+            out.write(b"USE ROLE SYSADMIN;\n\n")
+
+            for proc_info in self.generated_procedures:
+                out.write(f"-- Deploy: {proc_info['name']}\n".encode('utf-8'))
+                with open(proc_info['file'], 'rb') as f:
+                    shutil.copyfileobj(f, out, length=1 << 20)
+                out.write(b"\n\n")
+
+            # Add execution script
+            out.write(b"-- Execute Procedures\n")
+            out.write(b"-- " + b"=" * 50 + b"\n\n")
+
+            for proc_info in self.generated_procedures:
+                out.write(f"CALL {proc_info['target'].split('.')[0]}.{proc_info['name']}(\n".encode('utf-8'))
+                out.write(b"    P_LOAD_DATE => CURRENT_DATE(),\n")
+                out.write(b"    P_DEBUG_MODE => TRUE\n")
+                out.write(b");\n\n")
 
         logger.info(f"Deployment script generated: {output_file}")
         return str(output_file)
@@ -453,42 +720,120 @@ WHEN NOT MATCHED THEN
         """
         logger.info("Generating procedure documentation")
 
-        doc = "# Stored Procedure Documentation\n\n"
-        doc += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        for proc_info in self.generated_procedures:
-            doc += f"## {proc_info['name']}\n\n"
-            doc += f"**Target Table:** {proc_info['target']}\n"
-            doc += f"**Source Mapping:** {proc_info['mapping']}\n"
-            doc += f"**File:** {Path(proc_info['file']).name}\n\n"
-
-            doc += "### Parameters\n"
-            doc += "- `P_LOAD_DATE` (DATE): Load date for the data (default: CURRENT_DATE)\n"
-            doc += "- `P_BATCH_ID` (VARCHAR): Batch identifier (default: auto-generated)\n"
-            doc += "- `P_DEBUG_MODE` (BOOLEAN): Enable debug logging (default: FALSE)\n\n"
-
-            doc += "### Returns\n"
-            doc += "OBJECT containing:\n"
-            doc += "- `STATUS`: Execution status (SUCCESS/FAILED)\n"
-            doc += "- `ROWS_INSERTED`: Number of rows inserted\n"
-            doc += "- `ROWS_UPDATED`: Number of rows updated\n"
-            doc += "- `ROWS_DELETED`: Number of rows deleted\n"
-            doc += "- `ERROR_MESSAGE`: Error message if failed\n"
-            doc += "- `EXECUTION_TIME_SECONDS`: Total execution time\n"
-            doc += "- `BATCH_ID`: Batch identifier\n\n"
-
-            doc += "### Usage\n"
-            doc += "```sql\n"
-            doc += f"CALL {proc_info['target'].split('.')[0]}.{proc_info['name']}(\n"
-            doc += "    P_LOAD_DATE => '2025-11-16'::DATE,\n"
-            doc += "    P_DEBUG_MODE => TRUE\n"
-            doc += ");\n"
-            doc += "```\n\n"
+        # The markdown layout lives in DOC_TEMPLATE (compiled once at
+        # import); only the per-procedure fields are computed here
+        procs = [
+            {
+                'name': proc_info['name'],
+                'target': proc_info['target'],
+                'mapping': proc_info['mapping'],
+                'file_name': Path(proc_info['file']).name,
+                'call_schema': proc_info['target'].split('.')[0],
+            }
+            for proc_info in self.generated_procedures
+        ]
+        doc = _DOC_COMPILED.render(
+            generated_date=self._run_timestamp,
+            procs=procs
+        )
 
         # Save documentation
         output_file = self.output_dir / "PROCEDURES.md"
-        with open(output_file, 'w') as f:
-            f.write(doc)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(doc.encode('utf-8'))
 
         logger.info(f"Procedure documentation generated: {output_file}")
         return str(output_file)
+
+
+# Compiled lazily on first generator construction: Jinja's import and
+# its lex/parse/codegen pipeline are the heaviest part of loading this
+# module, and callers who only use other generators should not pay for
+# them. Compiled once per process after that; recompiling per mapping
+# would pay the pipeline N times. The on-disk bytecode cache also
+# spares repeated CLI invocations the cold-start parse/compile: later
+# processes unpickle the compiled code keyed on template name and
+# source hash.
+# Partial evaluation of the SP template: ~90% of it is an invariant SQL
+# frame, yet a full Jinja render re-executed the whole compiled program
+# per mapping. Rendering once with sentinel values and splitting at the
+# two indented body slots leaves three static segments; per-mapping
+# rendering is then a handful of str.replace calls and one join.
+_SP_SENTINELS = {
+    'procedure_name': '\x00PROC\x00',
+    'schema': '\x00SCHEMA\x00',
+    'description': '\x00DESC\x00',
+    'source_mapping': '\x00MAPPING\x00',
+    'generated_date': '\x00DATE\x00',
+    'source_system': '\x00SRCSYS\x00',
+    'target_system': '\x00TGTSYS\x00',
+    'merge_logic': '\x00MERGE\x00',
+    'quality_checks': '\x00QUALITY\x00',
+}
+_SP_SCALAR_KEYS = (
+    'procedure_name', 'schema', 'description', 'source_mapping',
+    'generated_date', 'source_system', 'target_system'
+)
+
+_MERGE_COMPILED = None
+_DOC_COMPILED = None
+
+
+def _init_templates() -> None:
+    """Compile the Jinja templates and SP skeleton on first use."""
+    global _MERGE_COMPILED, _DOC_COMPILED, _SP_PREFIX, _SP_MIDDLE, _SP_SUFFIX
+    if _MERGE_COMPILED is not None:
+        return
+
+    from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+    cache_dir = Path(tempfile.gettempdir()) / 'dw_migration_jinja_cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=DictLoader({
+            'sp': StoredProcedureGenerator.SP_TEMPLATE,
+            'merge': StoredProcedureGenerator.MERGE_TEMPLATE,
+            'doc': StoredProcedureGenerator.DOC_TEMPLATE,
+        }),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir))
+    )
+    _MERGE_COMPILED = env.get_template('merge')
+    _DOC_COMPILED = env.get_template('doc')
+
+    skeleton = env.get_template('sp').render(**_SP_SENTINELS)
+    _SP_PREFIX, _, rest = skeleton.partition(_SP_SENTINELS['merge_logic'])
+    _SP_MIDDLE, _, _SP_SUFFIX = rest.partition(_SP_SENTINELS['quality_checks'])
+
+
+def _render_mapping_process(output_dir: str, schema: str, mapping: InformaticaMapping):
+    """Render one mapping to SQL in a worker process (no file I/O).
+
+    The generator is rebuilt locally because its translator and manifest
+    state do not travel across process boundaries.
+    """
+    generator = StoredProcedureGenerator(output_dir=output_dir, schema=schema, incremental=False)
+    return generator._render_mapping(mapping)
+
+
+
+
+def _render_sp(merge_logic: str, quality_checks: str, **scalars) -> str:
+    """Assemble a procedure from the pre-rendered template segments.
+
+    Both body strings arrive with the 8-space frame indent already
+    baked in by their builders, so no indent pass is needed here.
+    """
+    def fill(segment: str) -> str:
+        for key in _SP_SCALAR_KEYS:
+            segment = segment.replace(_SP_SENTINELS[key], scalars[key])
+        return segment
+
+    return ''.join((
+        fill(_SP_PREFIX),
+        merge_logic,
+        fill(_SP_MIDDLE),
+        quality_checks,
+        fill(_SP_SUFFIX),
+    ))
@@ -2,9 +2,12 @@
 Main orchestrator for the data warehouse migration utility.
 """
 import click
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any
 from loguru import logger
+from rapidfuzz import fuzz, process
 
 from utils.logger import setup_logger
 from utils.config_loader import ConfigLoader
@@ -22,6 +25,20 @@ from generators.stored_proc_generator import StoredProcedureGenerator
 from validators.data_validator import DataValidator
 
 
+@dataclass(slots=True)
+class _TableEntry:
+    """Lightweight handle on one crawled table for the matching phase.
+
+    Shares the TableMetadata by reference instead of copying every
+    column into per-table dicts, which allocated O(total_columns) small
+    dicts on large schemas.
+    """
+    database: Optional[str]
+    schema: str
+    table_name: str
+    metadata: Any
+
+
 class MigrationOrchestrator:
     """Orchestrate the complete migration workflow."""
 
@@ -78,20 +95,28 @@ class MigrationOrchestrator:
         logger.info("=" * 80)
 
         try:
-            # Step 1: Crawl Oracle
+            # Steps 1-3: the two crawls are round-trip-bound DB work and
+            # the XML parse is local; all three are independent, so they
+            # run concurrently and the phase takes as long as the
+            # slowest step instead of their sum. Each worker opens its
+            # own connection, so nothing driver-level is shared across
+            # threads.
+            steps = []
             if crawl_oracle:
                 logger.info("\n[Step 1] Crawling Oracle Database...")
-                self.crawl_oracle_metadata()
-
-            # Step 2: Crawl Snowflake
+                steps.append(self.crawl_oracle_metadata)
             if crawl_snowflake:
                 logger.info("\n[Step 2] Crawling Snowflake Database...")
-                self.crawl_snowflake_metadata()
-
-            # Step 3: Parse Informatica
+                steps.append(self.crawl_snowflake_metadata)
             if parse_informatica:
                 logger.info("\n[Step 3] Parsing Informatica XML Files...")
-                self.parse_informatica_mappings()
+                steps.append(self.parse_informatica_mappings)
+
+            if steps:
+                with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                    futures = [executor.submit(step) for step in steps]
+                    for future in futures:
+                        future.result()
 
             # Step 4: Generate Mappings
             if generate_mappings:
@@ -172,61 +197,89 @@ class MigrationOrchestrator:
         )
 
         # Build table lists
-        oracle_tables = []
-        for schema in self.oracle_schemas:
-            for table in schema.tables:
-                oracle_tables.append({
-                    'schema': schema.schema_name,
-                    'table_name': table.table_name,
-                    'columns': [{'name': c.name, 'data_type': c.data_type} for c in table.columns],
-                    'primary_keys': table.primary_keys,
-                    'metadata': table
-                })
-
-        snowflake_tables = []
-        for schema in self.snowflake_schemas:
-            for table in schema.tables:
-                snowflake_tables.append({
-                    'database': schema.database,
-                    'schema': schema.schema_name,
-                    'table_name': table.table_name,
-                    'columns': [{'name': c.name, 'data_type': c.data_type} for c in table.columns],
-                    'primary_keys': table.primary_keys,
-                    'metadata': table
-                })
-
-        # Match tables
+        oracle_tables = [
+            _TableEntry(None, schema.schema_name, table.table_name, table)
+            for schema in self.oracle_schemas
+            for table in schema.tables
+        ]
+
+        snowflake_tables = [
+            _TableEntry(schema.database, schema.schema_name, table.table_name, table)
+            for schema in self.snowflake_schemas
+            for table in schema.tables
+        ]
+
+        # Match tables: name lookups are built once, exact and
+        # normalized hits resolve through them, and the remaining pairs
+        # are scored in a single cdist call instead of one fuzzy scan
+        # plus a linear next() resolution per Oracle table
+        sf_by_name = {t.table_name: t for t in snowflake_tables}
+        sf_by_upper = {name.upper(): name for name in sf_by_name}
+        normalize = fuzzy_matcher.normalize_name
+        sf_by_norm = {normalize(name): name for name in sf_by_name}
+        norm_targets = list(sf_by_norm.keys())
+
+        pending_tables = []
+        pending_norms = []
         for oracle_table in oracle_tables:
-            # Find best match in Snowflake
-            snowflake_table_names = [t['table_name'] for t in snowflake_tables]
-            match_result = fuzzy_matcher.find_best_match(
-                oracle_table['table_name'],
-                snowflake_table_names
-            )
+            table_name = oracle_table.table_name
 
-            if match_result:
-                matched_name, score, match_type = match_result
+            matched_name = sf_by_upper.get(table_name.upper())
+            if matched_name is not None:
+                self._append_table_mapping(
+                    oracle_table, sf_by_name[matched_name], 'exact', 1.0
+                )
+                continue
 
-                # Find the full Snowflake table object
-                snowflake_table = next(
-                    (t for t in snowflake_tables if t['table_name'] == matched_name),
-                    None
+            normalized = normalize(table_name)
+            matched_name = sf_by_norm.get(normalized)
+            if matched_name is not None:
+                self._append_table_mapping(
+                    oracle_table, sf_by_name[matched_name], 'normalized_exact', 0.95
                 )
+                continue
 
-                if snowflake_table:
-                    mapping = {
-                        'oracle_schema': oracle_table['schema'],
-                        'oracle_table': oracle_table['table_name'],
-                        'snowflake_database': snowflake_table['database'],
-                        'snowflake_schema': snowflake_table['schema'],
-                        'snowflake_table': snowflake_table['table_name'],
-                        'match_type': match_type,
-                        'match_score': score
-                    }
-                    self.table_mappings.append(mapping)
+            pending_tables.append(oracle_table)
+            pending_norms.append(normalized)
+
+        if pending_tables and norm_targets:
+            threshold = fuzzy_matcher.threshold
+            scores = process.cdist(
+                pending_norms,
+                norm_targets,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold,
+                workers=-1
+            )
+            for oracle_table, row in zip(pending_tables, scores):
+                best = int(row.argmax())
+                score = row[best]
+                if score >= threshold and score > 0:
+                    matched_name = sf_by_norm[norm_targets[best]]
+                    self._append_table_mapping(
+                        oracle_table, sf_by_name[matched_name], 'fuzzy', score / 100.0
+                    )
 
         logger.info(f"Generated {len(self.table_mappings)} table mappings")
 
+    def _append_table_mapping(
+        self,
+        oracle_table: _TableEntry,
+        snowflake_table: _TableEntry,
+        match_type: str,
+        score: float
+    ) -> None:
+        """Record a resolved Oracle-to-Snowflake table mapping."""
+        self.table_mappings.append({
+            'oracle_schema': oracle_table.schema,
+            'oracle_table': oracle_table.table_name,
+            'snowflake_database': snowflake_table.database,
+            'snowflake_schema': snowflake_table.schema,
+            'snowflake_table': snowflake_table.table_name,
+            'match_type': match_type,
+            'match_score': score
+        })
+
     def generate_stored_procedures(self) -> None:
         """Generate Snowflake stored procedures."""
         logger.info("Generating Snowflake stored procedures")
@@ -241,17 +294,20 @@ class MigrationOrchestrator:
 
         generator = StoredProcedureGenerator(output_dir, schema)
 
+        # Index Snowflake tables by name once; the per-mapping lookup
+        # was a nested scan over every schema and table
+        sf_table_index = {
+            table.table_name: table
+            for schema_meta in self.snowflake_schemas
+            for table in schema_meta.tables
+        }
+
         for mapping in self.informatica_mappings:
             try:
                 # Find corresponding Snowflake table metadata
                 target_metadata = None
                 if mapping.targets:
-                    target_name = mapping.targets[0].name
-                    for schema_meta in self.snowflake_schemas:
-                        for table in schema_meta.tables:
-                            if table.table_name == target_name:
-                                target_metadata = table
-                                break
+                    target_metadata = sf_table_index.get(mapping.targets[0].name)
 
                 generator.generate_from_mapping(mapping, target_metadata)
             except Exception as e:
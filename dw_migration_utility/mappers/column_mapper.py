@@ -1,8 +1,12 @@
 """
 Column-level mapping for Oracle to Snowflake migration.
 """
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+import pandas as pd
 from loguru import logger
+from rapidfuzz import fuzz, process
 
 from .fuzzy_matcher import FuzzyMatcher
 from ..crawlers.metadata_models import TableMetadata, ColumnMetadata
@@ -39,6 +43,10 @@ class ColumnMapper:
         """
         self.fuzzy_matcher = fuzzy_matcher or FuzzyMatcher()
         self.column_mappings = {}
+        # Columnar mirror of the nested dict: one tuple per mapping,
+        # so summary statistics and export run vectorized over a
+        # DataFrame instead of nested Python generator sums
+        self._rows = []
 
     def map_columns(
         self,
@@ -62,13 +70,24 @@ class ColumnMapper:
         logger.info(f"Mapping columns: {oracle_table.schema}.{oracle_table.table_name} -> {snowflake_table.schema}.{snowflake_table.table_name}")
 
         table_key = f"{oracle_table.schema}.{oracle_table.table_name}"
+        if table_key in self.column_mappings:
+            # Re-mapping a table: drop its old rows from the mirror
+            self._rows = [row for row in self._rows if row[0] != table_key]
         self.column_mappings[table_key] = {}
 
-        # Build Snowflake column lookup
+        # Build Snowflake column lookups once per table: by name, by
+        # uppercase name and by normalized name, so the per-column
+        # passes below are dict probes rather than candidate scans
         sf_columns = {col.name: col for col in snowflake_table.columns}
-        sf_column_names = list(sf_columns.keys())
+        sf_by_upper = {name.upper(): name for name in sf_columns}
+        normalize = self.fuzzy_matcher.normalize_name
+        sf_by_norm = {normalize(name): name for name in sf_columns}
+        norm_targets = list(sf_by_norm.keys())
+
+        # Columns left over for the batched fuzzy pass
+        pending_cols = []
+        pending_norms = []
 
-        # Map each Oracle column
         for oracle_col in oracle_table.columns:
             col_key = oracle_col.name
 
@@ -78,62 +97,114 @@ class ColumnMapper:
                 sf_col = sf_columns.get(sf_col_name)
 
                 if sf_col:
-                    self.column_mappings[table_key][col_key] = {
-                        'oracle_column': col_key,
-                        'oracle_type': oracle_col.data_type,
-                        'snowflake_column': sf_col_name,
-                        'snowflake_type': sf_col.data_type,
-                        'match_type': 'manual',
-                        'match_score': 1.0,
-                        'transformation': self._get_type_transformation(oracle_col, sf_col)
-                    }
+                    self._record_match(
+                        table_key, oracle_col, sf_col_name, sf_col, 'manual', 1.0
+                    )
                     logger.debug(f"Manual mapping: {col_key} -> {sf_col_name}")
                     continue
 
-            # Try fuzzy matching
-            column_data = [
-                {
-                    'name': col.name,
-                    'data_type': col.data_type,
-                    'nullable': col.nullable
-                }
-                for col in snowflake_table.columns
-            ]
-
-            match_result = self.fuzzy_matcher.find_best_match(
-                col_key,
-                sf_column_names,
-                use_normalization=True
+            # Exact, case-insensitive and normalized-exact matches all
+            # resolve via the lookups — the common case in migrations is
+            # an identically-named column, which never reaches the
+            # Levenshtein pass
+            if col_key in sf_columns:
+                self._record_match(
+                    table_key, oracle_col, col_key,
+                    sf_columns[col_key], 'exact', 1.0
+                )
+                continue
+
+            matched_name = sf_by_upper.get(col_key.upper())
+            if matched_name is not None:
+                self._record_match(
+                    table_key, oracle_col, matched_name,
+                    sf_columns[matched_name], 'case_insensitive', 0.99
+                )
+                continue
+
+            normalized = normalize(col_key)
+            matched_name = sf_by_norm.get(normalized)
+            if matched_name is not None:
+                self._record_match(
+                    table_key, oracle_col, matched_name,
+                    sf_columns[matched_name], 'normalized_exact', 0.95
+                )
+                continue
+
+            pending_cols.append(oracle_col)
+            pending_norms.append(normalized)
+
+        # Score all remaining pairs in one cdist call: rapidfuzz runs
+        # its bit-parallel Levenshtein kernel in C++ across the whole
+        # matrix (and across cores) instead of one Python-level
+        # find_best_match call per column
+        if pending_cols and norm_targets:
+            threshold = self.fuzzy_matcher.threshold
+            scores = process.cdist(
+                pending_norms,
+                norm_targets,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold,
+                workers=-1
             )
-
-            if match_result:
-                matched_name, score, match_type = match_result
-                sf_col = sf_columns.get(matched_name)
-
-                self.column_mappings[table_key][col_key] = {
-                    'oracle_column': col_key,
-                    'oracle_type': oracle_col.data_type,
-                    'snowflake_column': matched_name,
-                    'snowflake_type': sf_col.data_type if sf_col else None,
-                    'match_type': match_type,
-                    'match_score': score,
-                    'transformation': self._get_type_transformation(oracle_col, sf_col) if sf_col else None
-                }
-                logger.debug(f"Column match: {col_key} -> {matched_name} (score: {score:.2f})")
-            else:
-                self.column_mappings[table_key][col_key] = {
-                    'oracle_column': col_key,
-                    'oracle_type': oracle_col.data_type,
-                    'snowflake_column': None,
-                    'snowflake_type': None,
-                    'match_type': 'unmapped',
-                    'match_score': 0.0,
-                    'manual_review_required': True
-                }
-                logger.warning(f"No column match found: {col_key}")
+            for oracle_col, row in zip(pending_cols, scores):
+                best = int(row.argmax())
+                score = row[best]
+                if score >= threshold and score > 0:
+                    matched_name = sf_by_norm[norm_targets[best]]
+                    self._record_match(
+                        table_key, oracle_col, matched_name,
+                        sf_columns[matched_name], 'fuzzy', score / 100.0
+                    )
+                    logger.debug(f"Column match: {oracle_col.name} -> {matched_name} (score: {score / 100.0:.2f})")
+                else:
+                    self._record_unmapped(table_key, oracle_col)
+        else:
+            for oracle_col in pending_cols:
+                self._record_unmapped(table_key, oracle_col)
 
         return self.column_mappings[table_key]
 
+    def _record_match(
+        self,
+        table_key: str,
+        oracle_col: ColumnMetadata,
+        sf_col_name: str,
+        sf_col: ColumnMetadata,
+        match_type: str,
+        score: float
+    ) -> None:
+        """Record a resolved column mapping."""
+        transformation = self._get_type_transformation(oracle_col, sf_col)
+        self.column_mappings[table_key][oracle_col.name] = {
+            'oracle_column': oracle_col.name,
+            'oracle_type': oracle_col.data_type,
+            'snowflake_column': sf_col_name,
+            'snowflake_type': sf_col.data_type,
+            'match_type': match_type,
+            'match_score': score,
+            'transformation': transformation
+        }
+        self._rows.append(
+            (table_key, oracle_col.name, sf_col_name, match_type, score, transformation)
+        )
+
+    def _record_unmapped(self, table_key: str, oracle_col: ColumnMetadata) -> None:
+        """Record a column with no Snowflake counterpart."""
+        self.column_mappings[table_key][oracle_col.name] = {
+            'oracle_column': oracle_col.name,
+            'oracle_type': oracle_col.data_type,
+            'snowflake_column': None,
+            'snowflake_type': None,
+            'match_type': 'unmapped',
+            'match_score': 0.0,
+            'manual_review_required': True
+        }
+        self._rows.append(
+            (table_key, oracle_col.name, None, 'unmapped', 0.0, None)
+        )
+        logger.warning(f"No column match found: {oracle_col.name}")
+
     def _get_type_transformation(
         self,
         oracle_col: ColumnMetadata,
@@ -149,55 +220,22 @@ class ColumnMapper:
         Returns:
             Transformation SQL or None if no transformation needed
         """
-        oracle_type = oracle_col.data_type.upper()
-        snowflake_type = snowflake_col.data_type.upper()
-
-        # If types are already compatible, no transformation needed
-        if self._types_compatible(oracle_type, snowflake_type):
-            return None
-
-        # Check for common type conversions
-        if oracle_type == 'CLOB' and 'VARCHAR' in snowflake_type:
-            return f"CAST({oracle_col.name} AS VARCHAR({snowflake_col.length or 8000}))"
-
-        if 'BLOB' in oracle_type and 'BINARY' in snowflake_type:
-            return f"CAST({oracle_col.name} AS BINARY)"
-
-        if oracle_type == 'DATE' and 'TIMESTAMP' in snowflake_type:
-            return f"CAST({oracle_col.name} AS TIMESTAMP_NTZ)"
-
-        if 'VARCHAR' in oracle_type and 'CHAR' in snowflake_type and snowflake_col.length:
-            if oracle_col.length and oracle_col.length > snowflake_col.length:
-                return f"SUBSTRING({oracle_col.name}, 1, {snowflake_col.length})"
-            return f"CAST({oracle_col.name} AS {snowflake_type})"
-
-        # Default transformation
-        if oracle_type != snowflake_type:
-            return f"CAST({oracle_col.name} AS {snowflake_type})"
-
-        return None
+        # The transformation depends only on the type shapes, which a
+        # schema reuses constantly, so the rule scans are memoized and
+        # only the column-name substitution runs per call.
+        # ColumnMetadata uppercases data_type at construction.
+        template = _transformation_template(
+            oracle_col.data_type,
+            snowflake_col.data_type,
+            oracle_col.length,
+            snowflake_col.length
+        )
+        return template.format(name=oracle_col.name) if template else None
 
     def _types_compatible(self, oracle_type: str, snowflake_type: str) -> bool:
         """Check if two data types are compatible."""
-        # Numeric types
-        numeric_oracle = ['NUMBER', 'INTEGER', 'INT', 'FLOAT', 'DECIMAL', 'NUMERIC']
-        numeric_sf = ['DECIMAL', 'NUMBER', 'INTEGER', 'INT', 'FLOAT', 'DOUBLE', 'NUMERIC']
-
-        if any(t in oracle_type for t in numeric_oracle) and any(t in snowflake_type for t in numeric_sf):
-            return True
-
-        # String types
-        string_oracle = ['VARCHAR2', 'CHAR', 'VARCHAR', 'NVARCHAR2', 'NCHAR']
-        string_sf = ['VARCHAR', 'CHAR', 'TEXT', 'STRING']
-
-        if any(t in oracle_type for t in string_oracle) and any(t in snowflake_type for t in string_sf):
-            return True
-
-        # Date types
-        date_oracle = ['DATE', 'TIMESTAMP']
-        date_sf = ['DATE', 'TIMESTAMP', 'TIMESTAMP_NTZ', 'TIMESTAMP_LTZ', 'TIMESTAMP_TZ']
-
-        if any(t in oracle_type for t in date_oracle) and any(t in snowflake_type for t in date_sf):
+        family = _type_family(oracle_type)
+        if family is not None and family == _type_family(snowflake_type):
             return True
 
         # Exact match
@@ -248,16 +286,14 @@ class ColumnMapper:
             Summary statistics
         """
         total_tables = len(self.column_mappings)
-        total_columns = sum(len(cols) for cols in self.column_mappings.values())
-        mapped_columns = sum(
-            sum(1 for m in cols.values() if m.get('snowflake_column'))
-            for cols in self.column_mappings.values()
-        )
+        total_columns = len(self._rows)
+
+        # The counts reduce over the columnar mirror in C instead of
+        # nested generator sums over the dicts
+        df = self._to_dataframe()
+        mapped_columns = int(df['snowflake_column'].notna().sum())
         unmapped_columns = total_columns - mapped_columns
-        columns_needing_transformation = sum(
-            sum(1 for m in cols.values() if m.get('transformation'))
-            for cols in self.column_mappings.values()
-        )
+        columns_needing_transformation = int(df['transformation'].notna().sum())
 
         return {
             'total_tables': total_tables,
@@ -268,20 +304,31 @@ class ColumnMapper:
             'mapping_success_rate': (mapped_columns / total_columns * 100) if total_columns > 0 else 0
         }
 
+    _ROW_COLUMNS = (
+        'table_key', 'oracle_column', 'snowflake_column',
+        'match_type', 'match_score', 'transformation'
+    )
+
+    def _to_dataframe(self) -> pd.DataFrame:
+        """Build a DataFrame view of all recorded mappings."""
+        return pd.DataFrame(self._rows, columns=self._ROW_COLUMNS)
+
     def export_mappings(self, output_file: str) -> None:
         """
-        Export column mappings to JSON file.
+        Export column mappings to a JSON Lines file, one mapping per
+        line, with the summary appended as a final summary record.
 
         Args:
             output_file: Path to output file
         """
         import json
 
-        with open(output_file, 'w') as f:
-            json.dump({
-                'column_mappings': self.column_mappings,
-                'summary': self.get_mapping_summary()
-            }, f, indent=2)
+        df = self._to_dataframe()
+        df.to_json(output_file, orient='records', lines=True)
+
+        with open(output_file, 'a') as f:
+            f.write(json.dumps({'summary': self.get_mapping_summary()}))
+            f.write('\n')
 
         logger.info(f"Column mappings exported to: {output_file}")
 
@@ -339,3 +386,60 @@ class ColumnMapper:
         vals_str = ", ".join(insert_vals)
 
         return cols_str, vals_str
+
+
+# Classifying each type name into a family replaces the six substring
+# scans the compatibility check used to run per column pair with two
+# cached lookups. The regex runs only on the first sighting of a type
+# string; schemas reuse a handful of distinct types, so subsequent
+# calls are dict probes.
+_TYPE_FAMILY_RE = re.compile(
+    r'(?P<numeric>NUMBER|INTEGER|INT|FLOAT|DECIMAL|NUMERIC|DOUBLE)'
+    r'|(?P<string>CHAR|TEXT|STRING)'
+    r'|(?P<datetime>DATE|TIMESTAMP)'
+)
+
+
+@lru_cache(maxsize=None)
+def _type_family(data_type: str) -> Optional[str]:
+    """Classify an uppercase type name as numeric, string or datetime."""
+    match = _TYPE_FAMILY_RE.search(data_type)
+    return match.lastgroup if match else None
+
+
+@lru_cache(maxsize=1024)
+def _transformation_template(
+    oracle_type: str,
+    snowflake_type: str,
+    oracle_length: Optional[int],
+    snowflake_length: Optional[int]
+) -> Optional[str]:
+    """Build the conversion template for a type-shape pair.
+
+    Returns a format string with a {name} placeholder, or None when the
+    types are compatible as-is.
+    """
+    # If types are already compatible, no transformation needed
+    family = _type_family(oracle_type)
+    if family is not None and family == _type_family(snowflake_type):
+        return None
+    if oracle_type == snowflake_type:
+        return None
+
+    # Check for common type conversions
+    if oracle_type == 'CLOB' and 'VARCHAR' in snowflake_type:
+        return f"CAST({{name}} AS VARCHAR({snowflake_length or 8000}))"
+
+    if 'BLOB' in oracle_type and 'BINARY' in snowflake_type:
+        return "CAST({name} AS BINARY)"
+
+    if oracle_type == 'DATE' and 'TIMESTAMP' in snowflake_type:
+        return "CAST({name} AS TIMESTAMP_NTZ)"
+
+    if 'VARCHAR' in oracle_type and 'CHAR' in snowflake_type and snowflake_length:
+        if oracle_length and oracle_length > snowflake_length:
+            return f"SUBSTRING({{name}}, 1, {snowflake_length})"
+        return f"CAST({{name}} AS {snowflake_type})"
+
+    # Default transformation
+    return f"CAST({{name}} AS {snowflake_type})"
@@ -2,8 +2,7 @@
 Fuzzy matching algorithms for schema and column mapping.
 """
 from typing import List, Dict, Tuple, Optional
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process
 import re
 from loguru import logger
 
@@ -25,7 +24,7 @@ class FuzzyMatcher:
             ignore_prefixes: List of prefixes to ignore in matching
             ignore_suffixes: List of suffixes to ignore in matching
         """
-        self.threshold = threshold * 100  # fuzzywuzzy uses 0-100 scale
+        self.threshold = threshold * 100  # rapidfuzz uses 0-100 scale
         self.ignore_prefixes = ignore_prefixes or ['STG_', 'TMP_', 'HIST_', 'TEMP_']
         self.ignore_suffixes = ignore_suffixes or ['_BACKUP', '_OLD', '_BAK', '_TMP']
 
@@ -76,27 +75,37 @@ class FuzzyMatcher:
             return None
 
         # Try exact match first
+        source_upper = source_name.upper()
         for target in target_names:
-            if source_name.upper() == target.upper():
+            if source_upper == target.upper():
                 logger.debug(f"Exact match found: {source_name} -> {target}")
                 return (target, 1.0, 'exact')
 
-        # Try normalized exact match
+        # Normalize each candidate once and reuse the map for both the
+        # exact probe and the fuzzy pass, instead of re-normalizing the
+        # whole candidate list in each step
         if use_normalization:
             normalized_source = self.normalize_name(source_name)
-            for target in target_names:
-                if normalized_source == self.normalize_name(target):
-                    logger.debug(f"Normalized exact match: {source_name} -> {target}")
-                    return (target, 0.95, 'normalized_exact')
-
-        # Try fuzzy matching
-        if use_normalization:
-            search_name = self.normalize_name(source_name)
             search_targets = {self.normalize_name(t): t for t in target_names}
-            match_result = process.extractOne(search_name, search_targets.keys(), scorer=fuzz.ratio)
+
+            matched = search_targets.get(normalized_source)
+            if matched is not None:
+                logger.debug(f"Normalized exact match: {source_name} -> {matched}")
+                return (matched, 0.95, 'normalized_exact')
+
+            # score_cutoff lets the scorer abandon candidates that
+            # cannot reach the threshold instead of finishing the full
+            # distance computation for every pair
+            match_result = process.extractOne(
+                normalized_source, search_targets.keys(),
+                scorer=fuzz.ratio, score_cutoff=self.threshold
+            )
         else:
             search_targets = {t: t for t in target_names}
-            match_result = process.extractOne(source_name, target_names, scorer=fuzz.ratio)
+            match_result = process.extractOne(
+                source_name, target_names,
+                scorer=fuzz.ratio, score_cutoff=self.threshold
+            )
 
         if match_result and match_result[1] >= self.threshold:
             if use_normalization:
@@ -131,21 +140,21 @@ class FuzzyMatcher:
         normalized_source = self.normalize_name(source_name)
         search_targets = {self.normalize_name(t): t for t in target_names}
 
+        # The threshold is applied as a scorer cutoff, so hopeless
+        # candidates are dropped during scoring rather than filtered
+        # afterwards
         matches = process.extract(
             normalized_source,
             search_targets.keys(),
             scorer=fuzz.ratio,
+            score_cutoff=self.threshold,
             limit=top_n
         )
 
-        results = []
-        for match in matches:
-            if match[1] >= self.threshold:
-                original_name = search_targets[match[0]]
-                score = match[1] / 100.0
-                results.append((original_name, score))
-
-        return results
+        return [
+            (search_targets[match[0]], match[1] / 100.0)
+            for match in matches
+        ]
 
     def match_by_token_similarity(
         self,
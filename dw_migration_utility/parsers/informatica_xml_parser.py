@@ -1,13 +1,17 @@
 """
 Informatica XML parser for extracting mapping and transformation logic.
 """
-import xml.etree.ElementTree as ET
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import xmltodict
+from lxml import etree
 from loguru import logger
 from dataclasses import dataclass, field, asdict
 
+# Below this many files the process-pool startup outweighs the overlap
+_PARALLEL_FILE_THRESHOLD = 4
+
 
 @dataclass
 class SourceDefinition:
@@ -101,14 +105,19 @@ class InformaticaXMLParser:
         logger.info(f"Parsing Informatica XML: {self.xml_path}")
 
         try:
-            with open(self.xml_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-
-            # Parse XML to dictionary
-            xml_dict = xmltodict.parse(xml_content)
-
-            # Extract mapping information
-            self.mapping = self._extract_mapping(xml_dict)
+            # Stream the document instead of materializing it: iterparse
+            # hands over each MAPPING subtree as soon as its end tag is
+            # read, and clearing processed elements keeps peak memory at
+            # one subtree regardless of export size
+            for _, elem in etree.iterparse(str(self.xml_path), events=('end',), tag='MAPPING'):
+                self.mapping = self._extract_mapping(elem)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                break  # first mapping only, matching prior behaviour
+
+            if self.mapping is None:
+                raise ValueError("Could not find mapping data in XML")
 
             logger.info(f"Successfully parsed mapping: {self.mapping.name}")
             return self.mapping
@@ -117,89 +126,40 @@ class InformaticaXMLParser:
             logger.error(f"Failed to parse XML file: {e}")
             raise
 
-    def _extract_mapping(self, xml_dict: Dict) -> InformaticaMapping:
-        """Extract mapping from XML dictionary."""
-
-        # Navigate to mapping section (structure varies by Informatica version)
-        mapping_data = self._find_mapping_data(xml_dict)
-
-        if not mapping_data:
-            raise ValueError("Could not find mapping data in XML")
-
-        mapping_name = mapping_data.get('@NAME', 'Unknown')
-        mapping_desc = mapping_data.get('@DESCRIPTION', '')
-
+    def _extract_mapping(self, mapping_elem: etree._Element) -> InformaticaMapping:
+        """Extract mapping from a parsed MAPPING element."""
         mapping = InformaticaMapping(
-            name=mapping_name,
-            description=mapping_desc
+            name=mapping_elem.get('NAME', 'Unknown'),
+            description=mapping_elem.get('DESCRIPTION', '')
         )
 
-        # Extract sources
-        sources = self._extract_sources(mapping_data)
-        mapping.sources.extend(sources)
-
-        # Extract targets
-        targets = self._extract_targets(mapping_data)
-        mapping.targets.extend(targets)
-
-        # Extract transformations
-        transformations = self._extract_transformations(mapping_data)
-        mapping.transformations.extend(transformations)
-
-        # Extract connectors
-        connectors = self._extract_connectors(mapping_data)
-        mapping.connectors.extend(connectors)
+        mapping.sources.extend(self._extract_sources(mapping_elem))
+        mapping.targets.extend(self._extract_targets(mapping_elem))
+        mapping.transformations.extend(self._extract_transformations(mapping_elem))
+        mapping.connectors.extend(self._extract_connectors(mapping_elem))
 
         return mapping
 
-    def _find_mapping_data(self, xml_dict: Dict) -> Optional[Dict]:
-        """Find mapping data in XML structure."""
-        # Try common paths in Informatica XML structure
-        if 'POWERMART' in xml_dict:
-            powermart = xml_dict['POWERMART']
-            if 'REPOSITORY' in powermart:
-                repo = powermart['REPOSITORY']
-                if 'FOLDER' in repo:
-                    folder = repo['FOLDER']
-                    if isinstance(folder, list):
-                        folder = folder[0]
-                    if 'MAPPING' in folder:
-                        mapping = folder['MAPPING']
-                        if isinstance(mapping, list):
-                            return mapping[0]
-                        return mapping
-
-        return None
-
-    def _extract_sources(self, mapping_data: Dict) -> List[SourceDefinition]:
+    def _extract_sources(self, mapping_elem: etree._Element) -> List[SourceDefinition]:
         """Extract source definitions."""
         sources = []
 
-        source_nodes = mapping_data.get('SOURCE', [])
-        if not isinstance(source_nodes, list):
-            source_nodes = [source_nodes] if source_nodes else []
-
-        for source in source_nodes:
+        for source in mapping_elem.findall('SOURCE'):
             source_def = SourceDefinition(
-                name=source.get('@NAME', ''),
-                database_type=source.get('@DATABASETYPE', 'Oracle'),
-                database_name=source.get('@DBDNAME', ''),
-                owner=source.get('@OWNERNAME', '')
+                name=source.get('NAME', ''),
+                database_type=source.get('DATABASETYPE', 'Oracle'),
+                database_name=source.get('DBDNAME', ''),
+                owner=source.get('OWNERNAME', '')
             )
 
-            # Extract source fields
-            source_fields = source.get('SOURCEFIELD', [])
-            if not isinstance(source_fields, list):
-                source_fields = [source_fields] if source_fields else []
-
-            for field in source_fields:
+            for field in source.findall('SOURCEFIELD'):
                 col_info = {
-                    'name': field.get('@NAME', ''),
-                    'datatype': field.get('@DATATYPE', ''),
-                    'precision': field.get('@PRECISION', ''),
-                    'scale': field.get('@SCALE', ''),
-                    'nullable': field.get('@NULLABLE', 'NULL') == 'NULL',
-                    'key_type': field.get('@KEYTYPE', '')
+                    'name': field.get('NAME', ''),
+                    'datatype': field.get('DATATYPE', ''),
+                    'precision': field.get('PRECISION', ''),
+                    'scale': field.get('SCALE', ''),
+                    'nullable': field.get('NULLABLE', 'NULL') == 'NULL',
+                    'key_type': field.get('KEYTYPE', '')
                 }
                 source_def.columns.append(col_info)
 
@@ -207,35 +167,26 @@ class InformaticaXMLParser:
 
         return sources
 
-    def _extract_targets(self, mapping_data: Dict) -> List[TargetDefinition]:
+    def _extract_targets(self, mapping_elem: etree._Element) -> List[TargetDefinition]:
         """Extract target definitions."""
         targets = []
 
-        target_nodes = mapping_data.get('TARGET', [])
-        if not isinstance(target_nodes, list):
-            target_nodes = [target_nodes] if target_nodes else []
-
-        for target in target_nodes:
+        for target in mapping_elem.findall('TARGET'):
             target_def = TargetDefinition(
-                name=target.get('@NAME', ''),
-                database_type=target.get('@DATABASETYPE', 'Oracle'),
-                database_name=target.get('@DBDNAME', ''),
-                owner=target.get('@OWNERNAME', '')
+                name=target.get('NAME', ''),
+                database_type=target.get('DATABASETYPE', 'Oracle'),
+                database_name=target.get('DBDNAME', ''),
+                owner=target.get('OWNERNAME', '')
             )
 
-            # Extract target fields
-            target_fields = target.get('TARGETFIELD', [])
-            if not isinstance(target_fields, list):
-                target_fields = [target_fields] if target_fields else []
-
-            for field in target_fields:
+            for field in target.findall('TARGETFIELD'):
                 col_info = {
-                    'name': field.get('@NAME', ''),
-                    'datatype': field.get('@DATATYPE', ''),
-                    'precision': field.get('@PRECISION', ''),
-                    'scale': field.get('@SCALE', ''),
-                    'nullable': field.get('@NULLABLE', 'NULL') == 'NULL',
-                    'key_type': field.get('@KEYTYPE', '')
+                    'name': field.get('NAME', ''),
+                    'datatype': field.get('DATATYPE', ''),
+                    'precision': field.get('PRECISION', ''),
+                    'scale': field.get('SCALE', ''),
+                    'nullable': field.get('NULLABLE', 'NULL') == 'NULL',
+                    'key_type': field.get('KEYTYPE', '')
                 }
                 target_def.columns.append(col_info)
 
@@ -243,36 +194,28 @@ class InformaticaXMLParser:
 
         return targets
 
-    def _extract_transformations(self, mapping_data: Dict) -> List[Transformation]:
+    def _extract_transformations(self, mapping_elem: etree._Element) -> List[Transformation]:
         """Extract transformations."""
         transformations = []
 
-        # Get all transformation nodes
-        transform_nodes = mapping_data.get('TRANSFORMATION', [])
-        if not isinstance(transform_nodes, list):
-            transform_nodes = [transform_nodes] if transform_nodes else []
-
-        for trans in transform_nodes:
+        for trans in mapping_elem.findall('TRANSFORMATION'):
             transformation = Transformation(
-                name=trans.get('@NAME', ''),
-                type=trans.get('@TYPE', ''),
-                description=trans.get('@DESCRIPTION', '')
+                name=trans.get('NAME', ''),
+                type=trans.get('TYPE', ''),
+                description=trans.get('DESCRIPTION', '')
             )
 
-            # Extract transformation fields/ports
-            trans_fields = trans.get('TRANSFORMFIELD', [])
-            if not isinstance(trans_fields, list):
-                trans_fields = [trans_fields] if trans_fields else []
-
-            for field in trans_fields:
+            for field in trans.findall('TRANSFORMFIELD'):
                 port_info = {
-                    'name': field.get('@NAME', ''),
-                    'datatype': field.get('@DATATYPE', ''),
-                    'precision': field.get('@PRECISION', ''),
-                    'scale': field.get('@SCALE', ''),
-                    'port_type': field.get('@PORTTYPE', ''),  # INPUT, OUTPUT, VARIABLE
-                    'expression': field.get('@EXPRESSION', ''),
-                    'default_value': field.get('@DEFAULTVALUE', '')
+                    'name': field.get('NAME', ''),
+                    'datatype': field.get('DATATYPE', ''),
+                    'precision': field.get('PRECISION', ''),
+                    'scale': field.get('SCALE', ''),
+                    # Interned so downstream equality checks against the
+                    # INPUT/OUTPUT/VARIABLE constants are pointer compares
+                    'port_type': sys.intern(field.get('PORTTYPE', '')),
+                    'expression': field.get('EXPRESSION', ''),
+                    'default_value': field.get('DEFAULTVALUE', '')
                 }
                 transformation.ports.append(port_info)
 
@@ -280,36 +223,26 @@ class InformaticaXMLParser:
                 if port_info['expression']:
                     transformation.expressions[port_info['name']] = port_info['expression']
 
-            # Extract properties
-            table_attrs = trans.get('TABLEATTRIBUTE', [])
-            if not isinstance(table_attrs, list):
-                table_attrs = [table_attrs] if table_attrs else []
-
-            for attr in table_attrs:
-                prop_name = attr.get('@NAME', '')
-                prop_value = attr.get('@VALUE', '')
-                transformation.properties[prop_name] = prop_value
+            for attr in trans.findall('TABLEATTRIBUTE'):
+                prop_name = sys.intern(attr.get('NAME', ''))
+                transformation.properties[prop_name] = attr.get('VALUE', '')
 
             transformations.append(transformation)
 
         return transformations
 
-    def _extract_connectors(self, mapping_data: Dict) -> List[Connector]:
+    def _extract_connectors(self, mapping_elem: etree._Element) -> List[Connector]:
         """Extract connectors (data flow connections)."""
         connectors = []
 
-        connector_nodes = mapping_data.get('CONNECTOR', [])
-        if not isinstance(connector_nodes, list):
-            connector_nodes = [connector_nodes] if connector_nodes else []
-
-        for conn in connector_nodes:
+        for conn in mapping_elem.findall('CONNECTOR'):
             connector = Connector(
-                from_transformation=conn.get('@FROMTRANSFORMATION', ''),
-                from_instance=conn.get('@FROMINSTANCE', ''),
-                to_transformation=conn.get('@TOTRANSFORMATION', ''),
-                to_instance=conn.get('@TOINSTANCE', ''),
-                from_field=conn.get('@FROMFIELD', ''),
-                to_field=conn.get('@TOFIELD', '')
+                from_transformation=conn.get('FROMTRANSFORMATION', ''),
+                from_instance=conn.get('FROMINSTANCE', ''),
+                to_transformation=conn.get('TOTRANSFORMATION', ''),
+                to_instance=conn.get('TOINSTANCE', ''),
+                from_field=conn.get('FROMFIELD', ''),
+                to_field=conn.get('TOFIELD', '')
             )
             connectors.append(connector)
 
@@ -416,24 +349,32 @@ def parse_multiple_xml_files(xml_directory: str, pattern: str = "*.xml") -> List
     Returns:
         List of InformaticaMapping objects
     """
-    mappings = []
     xml_dir = Path(xml_directory)
 
     if not xml_dir.exists():
         logger.error(f"Directory not found: {xml_directory}")
-        return mappings
+        return []
 
-    xml_files = list(xml_dir.glob(pattern))
+    xml_files = [str(f) for f in xml_dir.glob(pattern)]
     logger.info(f"Found {len(xml_files)} XML files to parse")
 
-    for xml_file in xml_files:
-        try:
-            parser = InformaticaXMLParser(str(xml_file))
-            mapping = parser.parse()
-            mappings.append(mapping)
-        except Exception as e:
-            logger.error(f"Failed to parse {xml_file}: {e}")
-            continue
+    # Files are independent, so larger batches are parsed one process
+    # per core instead of sequentially
+    if len(xml_files) >= _PARALLEL_FILE_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_parse_xml_file, xml_files))
+    else:
+        results = [_parse_xml_file(xml_file) for xml_file in xml_files]
 
+    mappings = [mapping for mapping in results if mapping is not None]
     logger.info(f"Successfully parsed {len(mappings)} mappings")
     return mappings
+
+
+def _parse_xml_file(xml_file: str) -> Optional[InformaticaMapping]:
+    """Parse one XML file, returning None on failure."""
+    try:
+        return InformaticaXMLParser(xml_file).parse()
+    except Exception as e:
+        logger.error(f"Failed to parse {xml_file}: {e}")
+        return None
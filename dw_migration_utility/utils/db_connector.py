@@ -76,6 +76,71 @@ class OracleConnector:
             logger.error(f"Query execution failed: {e}")
             raise
 
+    def execute_query_iter(self, query: str, params: Optional[Dict] = None, arraysize: int = 1000):
+        """
+        Execute a SQL query and yield result rows in batches.
+
+        Keeps memory bounded for large result sets and fetches more rows
+        per round-trip than the driver default arraysize of 100.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            arraysize: Rows fetched per batch
+
+        Yields:
+            Lists of result rows
+        """
+        try:
+            self.cursor.arraysize = arraysize
+            if params:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+
+            while True:
+                chunk = self.cursor.fetchmany(arraysize)
+                if not chunk:
+                    break
+                yield chunk
+
+        except cx_Oracle.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+
+    def stream_query(self, query: str, params: Optional[Dict] = None, arraysize: int = 2000):
+        """
+        Execute a SQL query and yield rows one at a time.
+
+        Bounds peak memory on large result sets and drives the network
+        harder than the driver default arraysize of 100.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            arraysize: Rows fetched per round-trip
+
+        Yields:
+            Result rows
+        """
+        try:
+            self.cursor.arraysize = arraysize
+            self.cursor.prefetchrows = arraysize + 1
+            if params:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+
+            while True:
+                rows = self.cursor.fetchmany(arraysize)
+                if not rows:
+                    break
+                yield from rows
+
+        except cx_Oracle.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+
     def get_table_metadata(self, schema: str, table_name: str) -> Dict[str, Any]:
         """
         Get metadata for a specific table.
@@ -231,6 +296,33 @@ class SnowflakeConnector:
             logger.error(f"Query execution failed: {e}")
             raise
 
+    def execute_arrow(self, query: str, params: Optional[Dict] = None):
+        """
+        Execute a SQL query and return the result as a pandas DataFrame.
+
+        Uses the connector's Arrow result format, so column data moves
+        from Snowflake's buffers into pandas without building a Python
+        dict per row.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+
+        Returns:
+            pandas DataFrame of result rows
+        """
+        try:
+            if params:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+
+            return self.cursor.fetch_pandas_all()
+
+        except snowflake.connector.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+
     def get_table_metadata(self, database: str, schema: str, table_name: str) -> Dict[str, Any]:
         """
         Get metadata for a specific table.